@@ -5,6 +5,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import logging
 from config.settings import verify_required_env_vars
 from database.connector import AsyncDatabaseConnector
+from services.lottery_service import LotteryService
 
 from api.routers import prediction, lottery
 
@@ -30,6 +31,7 @@ async def lifespan(app: FastAPI):
 
     logger.info("애플리케이션 종료 중...")
     await AsyncDatabaseConnector.close_pool()
+    await LotteryService.close_session()
     logger.info("모든 리소스가 정상적으로 종료되었습니다.")
 
 
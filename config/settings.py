@@ -18,7 +18,11 @@ DB_CONFIG = {
     "user": os.getenv("DB_USER", "user"),
     "password": os.getenv("DB_PASSWORD", "password"),
     "database": os.getenv("DB_NAME", "lotto_db"),
-    "port": int(os.getenv("DB_PORT", "3306"))
+    "port": int(os.getenv("DB_PORT", "3306")),
+    # 동시 요청(/generate 등)이 커넥션을 기다리지 않도록 하는 풀 최대 크기
+    "pool_size": int(os.getenv("DATABASE_POOL_SIZE", "10")),
+    # MySQL wait_timeout에 끊긴 유휴 커넥션을 재사용하지 않도록 하는 재생성 주기(초)
+    "pool_recycle": int(os.getenv("DATABASE_POOL_RECYCLE", "1800")),
 }
 
 # 로또 설정
@@ -61,6 +65,19 @@ if not TELEGRAM_ADMIN_IDS and TELEGRAM_CHAT_ID:
     if _chat_id.isdigit():  # 양수(개인)만 해당
         TELEGRAM_ADMIN_IDS = {int(_chat_id)}
 
+# Webhook 모드 (TELEGRAM_WEBHOOK_URL이 있으면 polling 대신 webhook으로 업데이트 수신)
+# .env에 빈 값으로 남겨둔 항목은 미설정(None/기본값)으로 취급 (빈 secret_token은 setWebhook이 거부)
+TELEGRAM_WEBHOOK_URL = os.getenv("TELEGRAM_WEBHOOK_URL") or None
+TELEGRAM_WEBHOOK_LISTEN = os.getenv("TELEGRAM_WEBHOOK_LISTEN") or "0.0.0.0"
+TELEGRAM_WEBHOOK_PORT = int(os.getenv("TELEGRAM_WEBHOOK_PORT") or "8443")
+TELEGRAM_WEBHOOK_SECRET = os.getenv("TELEGRAM_WEBHOOK_SECRET") or None
+
+# 봇 상태 파일 (마지막으로 등록한 명령어 메뉴 해시). 작업 디렉터리가 아닌 프로젝트 data/ 아래에
+# 두며, 컨테이너 재배포 후에도 유지하려면 영구 볼륨 경로로 지정한다.
+BOT_COMMANDS_HASH_FILE = os.getenv("BOT_COMMANDS_HASH_FILE") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", ".bot_commands_hash"
+)
+
 # 동행복권 계정 (운영자 본인 단일 계정). 구매/잔액조회에 사용.
 DHL_USERNAME = os.getenv("DHL_USERNAME")
 DHL_PASSWORD = os.getenv("DHL_PASSWORD")
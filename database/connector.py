@@ -35,7 +35,8 @@ class AsyncDatabaseConnector:
                         charset='utf8mb4',
                         autocommit=True,
                         minsize=1,
-                        maxsize=10,
+                        maxsize=DB_CONFIG.get("pool_size", 10),
+                        pool_recycle=DB_CONFIG.get("pool_recycle", -1),
                         echo=False
                     )
                     logger.info("데이터베이스 연결 풀 생성됨")
@@ -85,15 +86,14 @@ class AsyncDatabaseConnector:
 
             try:
                 conn = await pool.acquire()
-                cursor = await conn.cursor(aiomysql.DictCursor)
-
-                await cursor.execute(query, params or ())
-
-                if fetch:
-                    result = await cursor.fetchall()
-                    return result
-                else:
-                    return cursor.rowcount
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute(query, params or ())
+
+                    if fetch:
+                        result = await cursor.fetchall()
+                        return result
+                    else:
+                        return cursor.rowcount
 
             except (aiomysql.OperationalError, aiomysql.InternalError) as e:
                 # 일시적 오류 - 재시도 가능
@@ -2,7 +2,7 @@
 import logging
 import aiomysql
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from database.connector import AsyncDatabaseConnector
 from config.settings import KST
@@ -11,6 +11,19 @@ from utils.exceptions import DatabaseError
 logger = logging.getLogger("lotto_prediction")
 
 
+def combinations_in_clause(numbers_list: List[List[int]]) -> Tuple[str, List[int]]:
+    """번호 조합 목록을 `(1~6) IN (...)` 조건절과 파라미터로 변환
+
+    각 조합은 정렬해서 넣으므로 저장된 정렬 순서와 무관하게 비교된다.
+    """
+    placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(numbers_list))
+    clause = f"(`1`, `2`, `3`, `4`, `5`, `6`) IN ({placeholders})"
+    params = []
+    for numbers in numbers_list:
+        params.extend(sorted(numbers))
+    return clause, params
+
+
 class AsyncLottoRepository:
     """비동기 로또 데이터 액세스 리포지토리"""
 
@@ -63,6 +76,22 @@ class AsyncLottoRepository:
         logger.info(f"최근 당첨 번호 조회 성공 (회차: {results[0]['no']})")
         return results[0]
 
+    @staticmethod
+    async def get_draw_by_no(draw_no: int) -> Optional[Dict[str, Any]]:
+        """특정 회차의 당첨 번호 조회 (비동기)"""
+        query = """
+        SELECT no, `1`, `2`, `3`, `4`, `5`, `6`, bonus, create_at
+        FROM result
+        WHERE no = %s
+        """
+
+        results = await AsyncDatabaseConnector.execute_query(query, (draw_no,))
+
+        if not results:
+            return None
+
+        return results[0]
+
     @staticmethod
     async def save_prediction(draw_no: int, numbers: List[int], score: float, common_count: int) -> bool:
         """예측 결과 저장 (비동기)"""
@@ -117,6 +146,78 @@ class AsyncLottoRepository:
             logger.error(f"예측 결과 저장 중 DB 오류: {e}, 번호: {sorted_numbers}, 회차: {next_no}")
             return False
 
+    @classmethod
+    async def save_recommendations_batch(
+        cls, numbers_list: List[List[int]], next_no: int, user_id: Optional[int] = None
+    ) -> int:
+        """여러 예측 결과를 recommand 테이블에 한 번에 저장 (비동기)
+
+        executemany로 다중 행 INSERT 한 번에 저장하고, 실패하면 행 단위 저장으로 대체한다.
+
+        Args:
+            numbers_list: 예측 번호 리스트 목록
+            next_no: 다음 회차 번호
+            user_id: 텔레그램 사용자 ID (선택)
+
+        Returns:
+            저장에 성공한 개수
+        """
+        if not numbers_list:
+            return 0
+
+        query = """
+        INSERT INTO recommand (next_no, user_id, `1`, `2`, `3`, `4`, `5`, `6`, create_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """
+
+        # create_at을 KST로 명시 저장 (MySQL 세션 타임존이 UTC여도 KST로 고정)
+        kst_now = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
+        params_list = [
+            (next_no, user_id, *sorted(numbers), kst_now) for numbers in numbers_list
+        ]
+
+        try:
+            pool = await AsyncDatabaseConnector.get_pool()
+            async with pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.executemany(query, params_list)
+                    saved = cursor.rowcount
+
+            logger.info(f"예측 결과 일괄 저장 성공: {saved}개, 회차: {next_no}, user_id: {user_id}")
+            return saved
+        except Exception as e:
+            logger.warning(f"예측 결과 일괄 저장 실패, 개별 저장으로 재시도: {e}")
+
+        saved = 0
+        for numbers in numbers_list:
+            if await cls.save_recommendation(numbers, next_no, user_id):
+                saved += 1
+        return saved
+
+    @staticmethod
+    async def count_recommendations_in(next_no: int, numbers_list: List[List[int]]) -> int:
+        """주어진 조합 중 해당 회차 recommand 테이블에 존재하는 서로 다른 조합 수 조회 (비동기)
+
+        행을 모두 가져오지 않고 DB에서 포함 여부만 세어 반환한다.
+        """
+        if not numbers_list:
+            return 0
+
+        in_clause, in_params = combinations_in_clause(numbers_list)
+        query = f"""
+        SELECT COUNT(DISTINCT `1`, `2`, `3`, `4`, `5`, `6`) AS count
+        FROM recommand
+        WHERE next_no = %s
+        AND {in_clause}
+        """
+
+        results = await AsyncDatabaseConnector.execute_query(query, (next_no, *in_params))
+
+        if not results:
+            return 0
+
+        return results[0]['count']
+
     @staticmethod
     async def save_draw_result(
         draw_no: int, numbers: List[int], bonus: Optional[int] = None
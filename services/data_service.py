@@ -1,4 +1,5 @@
 # services/data_service.py - 오류 처리 개선
+import asyncio
 import logging
 from typing import List, Set, Dict, Optional
 from database.repositories.lotto_repository import AsyncLottoRepository
@@ -15,9 +16,16 @@ class AsyncDataService:
     def __init__(self):
         self.draws = []
         self.existing_combinations = set()
+        # 동시에 들어온 재로딩(자동 업데이트 + /update)이 서로 덮어쓰지 않도록 직렬화
+        self._reload_lock = asyncio.Lock()
 
     async def load_historical_data(self, start_no=601, end_no=None):
-        """역대 당첨 데이터 로드 (비동기)"""
+        """역대 당첨 데이터 로드 (비동기, 동시 호출은 순서대로 실행)"""
+        async with self._reload_lock:
+            return await self._load_historical_data(start_no, end_no)
+
+    async def _load_historical_data(self, start_no, end_no):
+        """역대 당첨 데이터 로드 본체 (_reload_lock 안에서 호출)"""
         # 입력 검증
         if start_no <= 0:
             logger.error(f"잘못된 시작 회차: {start_no}")
@@ -78,12 +86,56 @@ class AsyncDataService:
             # 데이터베이스 예외는 상위로 전달하여 처리
             raise
 
+    def append_draw(self, row: Dict, max_draws: Optional[int] = None) -> bool:
+        """
+        새 회차 1건을 로드된 데이터 끝에 추가 (전체 재로딩 없이 증분 반영)
+
+        Args:
+            row: result 테이블 행 (no, 1~6, bonus, create_at)
+            max_draws: 유지할 최대 회차 수 (초과분은 오래된 회차부터 제거)
+
+        Returns:
+            반영 성공 여부 (이미 로드된 회차면 True, 연속되지 않거나 유효하지 않으면 False)
+        """
+        try:
+            draw = LottoDraw.from_db_row(row)
+        except Exception as e:
+            logger.warning(f"유효하지 않은 회차 데이터 (회차: {row.get('no')}): {e}")
+            return False
+
+        last_draw = self.get_last_draw()
+        if last_draw:
+            if draw.draw_no <= last_draw.draw_no:
+                return True
+            if draw.draw_no != last_draw.draw_no + 1:
+                logger.warning(f"연속되지 않는 회차 추가 요청: {last_draw.draw_no} -> {draw.draw_no}")
+                return False
+
+        self.draws.append(draw)
+        # DuplicateChecker가 같은 집합을 참조하므로 제자리에서 갱신
+        self.existing_combinations.add(draw.get_numbers_tuple())
+
+        if max_draws is not None and len(self.draws) > max_draws:
+            evicted = self.draws[:-max_draws]
+            del self.draws[:-max_draws]
+            for old in evicted:
+                self.existing_combinations.discard(old.get_numbers_tuple())
+
+        logger.info(f"{draw.draw_no}회 데이터 추가 (보유: {len(self.draws)}개 회차)")
+        return True
+
     def get_last_draw(self) -> Optional[LottoDraw]:
         """마지막 회차 데이터 반환"""
         if not self.draws:
             return None
         return self.draws[-1]
 
+    def get_next_draw_no(self) -> Optional[int]:
+        """다음 회차 번호 반환 (로드된 데이터가 없으면 None)"""
+        if not self.draws:
+            return None
+        return self.draws[-1].draw_no + 1
+
     def get_all_draws(self) -> List[LottoDraw]:
         """모든 당첨 데이터 반환"""
         return self.draws
@@ -202,4 +254,4 @@ class AsyncDataService:
             raise
         except Exception as e:
             logger.error(f"예측 저장 중 오류: {e}")
-            raise DataLoadError(f"예측 저장 실패: {e}")
\ No newline at end of file
+            raise DataLoadError(f"예측 저장 실패: {e}")
@@ -78,7 +78,7 @@ class DuplicateChecker:
             is_dup = combo_tuple in winning_combinations
             
             if is_dup:
-                logger.debug(f"중복 조합 감지: {combination}")
+                logger.debug("중복 조합 감지: %s", combination)
             
             return is_dup
             
@@ -3,7 +3,6 @@ import json
 import logging
 import aiohttp
 import asyncio
-import requests
 from typing import Dict, Any, Optional, List
 
 from database.repositories.lotto_repository import AsyncLottoRepository
@@ -18,6 +17,39 @@ class LotteryService:
     # 동행복권 공식 API URL
     API_URL = "https://www.dhlottery.co.kr/lt645/selectPstLt645Info.do?srchLtEpsd={draw_no}"
 
+    # 요청마다 연결을 새로 맺지 않도록 공유하는 HTTP 세션 (첫 조회 시 생성)
+    # 세션은 생성한 이벤트 루프에 묶이므로 루프도 함께 기록
+    _session: Optional[aiohttp.ClientSession] = None
+    _session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """현재 이벤트 루프용 공유 HTTP 세션 반환 (없거나 닫혔거나 다른 루프용이면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if cls._session is None or cls._session.closed or cls._session_loop is not loop:
+            if cls._session is not None and not cls._session.closed:
+                # 다른(대개 이미 종료된) 루프의 세션은 이 루프에서 닫을 수 없으므로 버림
+                logger.warning("다른 이벤트 루프에서 생성된 HTTP 세션을 버리고 새로 생성합니다")
+            # 동행복권은 봇 차단을 하므로 브라우저 User-Agent 헤더 전송
+            cls._session = aiohttp.ClientSession(
+                headers={"User-Agent": "Mozilla/5.0"},
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+            cls._session_loop = loop
+        return cls._session
+
+    @classmethod
+    async def close_session(cls):
+        """공유 HTTP 세션 종료 (애플리케이션 종료 시 호출)"""
+        if (
+            cls._session is not None
+            and not cls._session.closed
+            and cls._session_loop is asyncio.get_running_loop()
+        ):
+            await cls._session.close()
+        cls._session = None
+        cls._session_loop = None
+
     @classmethod
     async def fetch_draw_result(cls, draw_no: int) -> Optional[Dict[str, Any]]:
         """지정된 회차의 로또 당첨 정보 조회 (동행복권 공식 API 사용)
@@ -30,19 +62,18 @@ class LotteryService:
             url = cls.API_URL.format(draw_no=draw_no)
             logger.info(f"로또 {draw_no}회차 당첨 정보 조회 요청 중: {url}")
 
-            # 동행복권은 봇 차단을 하므로 브라우저 User-Agent 헤더 전송
-            headers = {"User-Agent": "Mozilla/5.0"}
-            response = requests.get(url, headers=headers, timeout=10)
+            # 비동기 조회로 이벤트 루프(봇 응답)를 막지 않음
+            async with cls._get_session().get(url) as response:
+                if response.status != 200:
+                    logger.error(f"로또 당첨 정보 조회 실패 (HTTP {response.status})")
+                    return None
 
-            if response.status_code != 200:
-                logger.error(f"로또 당첨 정보 조회 실패 (HTTP {response.status_code})")
-                return None
-
-            try:
-                payload = response.json()
-            except ValueError:
-                logger.error(f"로또 {draw_no}회차 응답이 JSON 형식이 아님 (차단되었거나 잘못된 응답)")
-                return None
+                try:
+                    # 차단 시 text/html로 응답하므로 Content-Type은 검사하지 않음
+                    payload = await response.json(content_type=None)
+                except ValueError:
+                    logger.error(f"로또 {draw_no}회차 응답이 JSON 형식이 아님 (차단되었거나 잘못된 응답)")
+                    return None
 
             # 미발표 회차는 list가 비어 있음
             rows = (payload.get("data") or {}).get("list") or []
@@ -94,7 +125,7 @@ class LotteryService:
                 return False
 
             # 로그에 원본 데이터 출력
-            logger.debug(f"로또 {draw_no}회차 당첨 정보 조회 결과: {data}")
+            logger.debug("로또 %s회차 당첨 정보 조회 결과: %s", draw_no, data)
 
             # 2. 당첨번호 및 보너스 번호 추출
             numbers = [
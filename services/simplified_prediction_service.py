@@ -105,7 +105,7 @@ class SimplifiedPredictionService:
                 )
                 predictions.append(prediction)
                 
-                logger.debug(f"예측 {i+1}/{num_predictions} 생성 완료: {combination}")
+                logger.debug("예측 %d/%d 생성 완료: %s", i + 1, num_predictions, combination)
             
             elapsed_time = (datetime.now(KST) - start_time).total_seconds() * 1000
             logger.info(
@@ -158,8 +158,8 @@ class SimplifiedPredictionService:
             if is_historical_duplicate:
                 retry_count += 1
                 logger.debug(
-                    f"과거 당첨 번호와 중복: {combination}, "
-                    f"재시도 {retry_count}/{self.max_retries}"
+                    "과거 당첨 번호와 중복: %s, 재시도 %d/%d",
+                    combination, retry_count, self.max_retries
                 )
                 continue
             
@@ -167,8 +167,8 @@ class SimplifiedPredictionService:
             if len(prev_numbers.intersection(combination)) >= 3:
                 retry_count += 1
                 logger.debug(
-                    f"직전 회차와 3개 이상 겹침: {combination}, "
-                    f"재시도 {retry_count}/{self.max_retries}"
+                    "직전 회차와 3개 이상 겹침: %s, 재시도 %d/%d",
+                    combination, retry_count, self.max_retries
                 )
                 continue
             
@@ -177,13 +177,13 @@ class SimplifiedPredictionService:
             if combo_tuple in generated_combinations:
                 retry_count += 1
                 logger.debug(
-                    f"배치 내 중복: {combination}, "
-                    f"재시도 {retry_count}/{self.max_retries}"
+                    "배치 내 중복: %s, 재시도 %d/%d",
+                    combination, retry_count, self.max_retries
                 )
                 continue
             
             # 유효한 조합 발견
-            logger.debug(f"유효한 조합 생성: {combination}")
+            logger.debug("유효한 조합 생성: %s", combination)
             return combination
         
         # 최대 재시도 횟수 초과
@@ -4,21 +4,32 @@
 """
 
 import asyncio
+import hashlib
+import io
 import logging
+import random
+import time
+from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlparse
 
 from telegram import Update, Bot, BotCommand, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
-    Application, CommandHandler, ContextTypes,
+    AIORateLimiter, Application, CommandHandler, ContextTypes,
     MessageHandler, CallbackQueryHandler, filters
 )
+from telegram.error import BadRequest, Forbidden, RetryAfter
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from config.settings import (
     TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, TELEGRAM_ADMIN_IDS,
+    TELEGRAM_WEBHOOK_URL, TELEGRAM_WEBHOOK_LISTEN, TELEGRAM_WEBHOOK_PORT,
+    TELEGRAM_WEBHOOK_SECRET, BOT_COMMANDS_HASH_FILE as _BOT_COMMANDS_HASH_PATH,
     DHL_USERNAME, DHL_PASSWORD, KST,
 )
 from database.repositories.lotto_repository import AsyncLottoRepository
@@ -40,10 +51,158 @@ logger = logging.getLogger(__name__)
 data_service: Optional[AsyncDataService] = None
 prediction_service: Optional[SimplifiedPredictionService] = None
 scheduler: Optional[AsyncIOScheduler] = None
+# 스케줄 작업 공용 Bot (Application의 Bot을 재사용해 HTTP 연결 풀 공유)
+scheduled_bot: Optional[Bot] = None
+
+# 회차별 당첨 번호 캐시 (발표된 당첨 번호는 변하지 않으므로 만료 없음)
+# 임의 회차 조회(/result [회차])로 무한히 커지지 않도록 최근 사용 순으로 WINNING_CACHE_SIZE개만 유지
+WINNING_CACHE_SIZE = 32
+_winning_cache: OrderedDict[int, Dict[str, Any]] = OrderedDict()
+
+# 최근 회차 캐시 (조회 시각, 행) — 새 회차는 주 1회만 추가되므로 짧은 TTL로 충분
+LAST_DRAW_CACHE_TTL = 60
+_last_draw_cache: Optional[tuple] = None
+_last_draw_lock = asyncio.Lock()
+
+# 예측에 사용하는 최근 회차 수
+HISTORY_WINDOW = 10
+
+# /generate 처리 중인 사용자 (연타 시 같은 작업이 중복 실행되지 않도록)
+_generating_users: Set[int] = set()
 
 # 메시지 발송 재시도 설정
 MAX_SEND_RETRIES = 3
 RETRY_DELAY_SECONDS = 10
+MAX_BACKOFF_SECONDS = 60
+
+# 당첨번호 자동 업데이트 재시도 설정 (미발표 대비)
+UPDATE_MAX_RETRIES = 3
+UPDATE_RETRY_MINUTES = 10
+
+# 고정 안내 메시지 / 명령어 메뉴 (요청마다 다시 만들지 않도록 모듈 로드 시 한 번 생성)
+_WELCOME_MESSAGE = (
+    "🎰 로또 예측 봇 🎰\n\n"
+    "사용 가능한 명령어:\n"
+    "🔮 /generate - 5개 조합 생성 (기본)\n"
+    "🔮 /generate [개수] - 원하는 개수만큼 생성 (최대 20개)\n"
+    "📋 /mylist - 이번 회차 생성된 전체 번호 보기\n"
+    "🏆 /winning - 최신 회차 당첨 번호 확인\n"
+    "📊 /result - 내 예측과 당첨 번호 매칭 확인\n"
+    "📊 /result [회차] - 특정 회차 결과 확인\n"
+    "🔄 /update - 최신 당첨번호 수동 업데이트\n"
+    "❓ /help - 명령어 안내\n"
+    "🏠 /start - 시작 메시지 표시"
+)
+
+_HELP_MESSAGE = (
+    "📖 명령어 안내\n\n"
+    "🔮 예측 생성:\n"
+    "  /generate - 5개 조합 생성 (기본)\n"
+    "  /generate [개수] - 원하는 개수만큼 생성 (최대 20개)\n"
+    "  예: /generate 10\n\n"
+    "📋 내 번호 확인:\n"
+    "  /mylist - 이번 회차 생성된 전체 번호 보기\n\n"
+    "🏆 당첨 확인:\n"
+    "  /winning - 최신 회차 당첨 번호 확인\n"
+    "  /update - 최신 당첨번호 수동 업데이트\n\n"
+    "📊 결과 확인:\n"
+    "  /result - 내가 생성한 번호와 당첨 번호 매칭 확인\n"
+    "  /result [회차] - 특정 회차 결과 확인\n"
+    "  예: /result 1150\n\n"
+    "⚙️ 기타:\n"
+    "  /help - 이 메시지 표시\n"
+    "  /start - 시작 메시지 표시\n\n"
+    "⏰ 참고: 당첨 번호는 매주 토요일 밤 9시에 자동 업데이트됩니다."
+)
+
+_UNKNOWN_MESSAGE = (
+    "❓ 알 수 없는 명령어입니다.\n\n"
+    "사용 가능한 명령어:\n"
+    "🔮 /generate - 예측 생성 (기본 5개)\n"
+    "🔮 /generate [개수] - 원하는 개수만큼 생성 (최대 20개)\n"
+    "📋 /mylist - 이번 회차 내 번호 보기\n"
+    "🏆 /winning - 당첨 번호 확인\n"
+    "🔄 /update - 최신 당첨번호 수동 업데이트\n"
+    "📊 /result - 내 예측과 당첨 번호 매칭 확인\n"
+    "📊 /result [회차] - 특정 회차 결과 확인\n"
+    "❓ /help - 명령어 안내\n"
+    "🏠 /start - 시작 메시지 표시"
+)
+
+_DONATE_MARKUP = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("☕ 후원하기 (카카오페이)", url="https://qr.kakaopay.com/Ej74xpc815dc06149")]]
+)
+
+# 마지막으로 등록한 명령어 메뉴 해시 (같으면 시작 시 set_my_commands 생략)
+BOT_COMMANDS_HASH_FILE = Path(_BOT_COMMANDS_HASH_PATH)
+
+_BOT_COMMANDS = [
+    BotCommand("start", "시작 메시지 표시"),
+    BotCommand("generate", "예측 번호 생성"),
+    BotCommand("mylist", "이번 회차 내 번호 보기"),
+    BotCommand("winning", "당첨 번호 확인"),
+    BotCommand("result", "결과 확인"),
+    BotCommand("balance", "동행복권 예치금 조회"),
+    BotCommand("buy", "로또645 구매"),
+    BotCommand("buylist", "구매 내역 조회"),
+    BotCommand("help", "명령어 안내"),
+]
+
+
+async def cached_last_draw(refresh: bool = False) -> Optional[Dict[str, Any]]:
+    """최근 회차 조회 (LAST_DRAW_CACHE_TTL초 동안 캐시)
+
+    캐시가 만료된 동시 요청은 락으로 묶어 DB 조회를 한 번만 수행한다.
+
+    Args:
+        refresh: True면 캐시를 무시하고 DB에서 다시 조회 (새 회차 저장 직후)
+    """
+    global _last_draw_cache
+
+    async with _last_draw_lock:
+        if (
+            not refresh
+            and _last_draw_cache
+            and time.monotonic() - _last_draw_cache[0] < LAST_DRAW_CACHE_TTL
+        ):
+            return _last_draw_cache[1]
+
+        last_draw = await AsyncLottoRepository.get_last_draw()
+        if last_draw:
+            _last_draw_cache = (time.monotonic(), last_draw)
+        return last_draw
+
+
+async def cached_next_draw_no() -> Optional[int]:
+    """다음 회차 번호 (최근 회차 캐시 기준, 최근 회차가 없으면 None)
+
+    API 프로세스가 새 회차를 저장할 수 있으므로 DB 기준 캐시를 우선하고,
+    로드된 데이터가 뒤처져 있으면 이번에 함께 동기화한다.
+    예측 생성이 최신 회차 기준이 되도록 생성 전에 호출해야 한다.
+    """
+    last_draw = await cached_last_draw()
+    if not last_draw:
+        return None
+
+    next_no = last_draw['no'] + 1
+    if data_service is not None:
+        loaded_next_no = data_service.get_next_draw_no()
+        if loaded_next_no is not None and loaded_next_no < next_no:
+            logger.info(f"로드된 데이터가 뒤처짐 ({loaded_next_no - 1}회 < {last_draw['no']}회), 동기화")
+            await _sync_data_service(last_draw)
+    return next_no
+
+
+async def _sync_data_service(last_draw: Dict[str, Any]):
+    """새 회차를 데이터 서비스에 반영 (새 회차만 추가, 불연속이면 전체 재로딩)"""
+    last_draw_no = last_draw['no']
+    if not data_service.append_draw(last_draw, max_draws=HISTORY_WINDOW):
+        start_no = max(1, last_draw_no - HISTORY_WINDOW + 1)
+        await data_service.load_historical_data(
+            start_no=start_no, end_no=last_draw_no
+        )
+    # 전체 재로딩 시 조합 집합이 교체되므로 중복 검사 캐시도 즉시 갱신
+    prediction_service.duplicate_checker.clear_cache()
 
 
 async def initialize_services():
@@ -60,10 +219,10 @@ async def initialize_services():
     )
 
     # 최근 데이터 로드
-    last_draw = await AsyncLottoRepository.get_last_draw()
+    last_draw = await cached_last_draw()
     if last_draw:
         last_draw_no = last_draw['no']
-        start_no = max(1, last_draw_no - 9)
+        start_no = max(1, last_draw_no - HISTORY_WINDOW + 1)
         await data_service.load_historical_data(
             start_no=start_no, end_no=last_draw_no
         )
@@ -84,7 +243,7 @@ async def send_message_with_retry(
         chat_id: 대상 채팅 ID
         text: 발송할 메시지
         max_retries: 최대 재시도 횟수
-        retry_delay: 재시도 간격(초)
+        retry_delay: 재시도 기본 간격(초), 지터 포함 최대 MAX_BACKOFF_SECONDS
 
     Returns:
         발송 성공 여부
@@ -92,16 +251,27 @@ async def send_message_with_retry(
     for attempt in range(1, max_retries + 1):
         try:
             await bot.send_message(chat_id=chat_id, text=text)
-            logger.info(f"메시지 발송 성공 (시도 {attempt}/{max_retries})")
+            logger.info("메시지 발송 성공 (시도 %d/%d)", attempt, max_retries)
             return True
+        except (Forbidden, BadRequest) as e:
+            # 차단/잘못된 채팅 ID 등은 재시도해도 성공할 수 없음
+            logger.error(f"메시지 발송 불가 (chat_id: {chat_id}): {e}")
+            return False
+        except RetryAfter as e:
+            # RetryAfter 재시도는 AIORateLimiter가 이미 소진했으므로 여기서 다시 기다리지 않음
+            logger.error(f"메시지 발송 실패 (chat_id: {chat_id}, 전송 한도 초과): {e}")
+            return False
         except Exception as e:
             logger.warning(
                 f"메시지 발송 실패 (시도 {attempt}/{max_retries}): {e}"
             )
             if attempt < max_retries:
-                # 지수 백오프: 10초, 20초, 40초...
-                delay = retry_delay * (2 ** (attempt - 1))
-                logger.info(f"{delay}초 후 재시도...")
+                # 지터를 섞은 지수 백오프 (동시 실패 시 재시도 시점 분산)
+                delay = min(
+                    MAX_BACKOFF_SECONDS,
+                    random.uniform(retry_delay, retry_delay * 3 * (2 ** (attempt - 1)))
+                )
+                logger.info("%.1f초 후 재시도...", delay)
                 await asyncio.sleep(delay)
 
     logger.error(
@@ -111,85 +281,128 @@ async def send_message_with_retry(
     return False
 
 
-async def update_lottery_results(retry_count: int = 0):
-    """토요일 밤 9시 당첨번호 자동 업데이트 및 결과 알림
-    
-    Args:
-        retry_count: 현재 재시도 횟수 (최대 3회)
+# 메시지에 표시하는 시각 포맷 (KST)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _now_str() -> str:
+    """현재 한국 시각 문자열
+
+    컨테이너 로컬 타임존과 무관하게 KST로 표시하기 위해 time.strftime 대신 KST datetime을 사용한다.
     """
-    max_retries = 3
-    logger.info(f"당첨번호 자동 업데이트 시작 (시도 {retry_count + 1}/{max_retries + 1})")
+    return datetime.now(KST).strftime(TIMESTAMP_FORMAT)
 
-    bot = Bot(token=TELEGRAM_BOT_TOKEN)
 
-    try:
-        success = await LotteryService.update_latest_draw()
+# 6개 번호 조합 포맷 (join + str 변환 대신 % 포맷 한 번으로 처리)
+_COMBO_FORMAT = ", ".join(["%d"] * 6)
 
-        if success:
-            logger.info("당첨번호 업데이트 성공")
 
-            # 데이터 서비스 새로고침
-            last_draw = await AsyncLottoRepository.get_last_draw()
-            if last_draw:
-                last_draw_no = last_draw['no']
-                start_no = max(1, last_draw_no - 9)
-                await data_service.load_historical_data(
-                    start_no=start_no, end_no=last_draw_no
-                )
+def _fmt_combo(nums) -> str:
+    """번호 조합 문자열 변환 (예: "1, 5, 12, 23, 34, 45")"""
+    if len(nums) == 6:
+        return _COMBO_FORMAT % tuple(nums)
+    return ", ".join(map(str, nums))
 
-                # 당첨번호 알림 발송 (보너스 번호 포함)
-                numbers = [last_draw[str(i)] for i in range(1, 7)]
-                numbers_str = ", ".join(str(n) for n in sorted(numbers))
-                bonus = last_draw.get('bonus')
-                bonus_str = f"\n🎯 보너스 번호: {bonus}" if bonus else ""
 
-                message = (
-                    f"🏆 {last_draw_no}회 당첨번호 업데이트\n\n"
-                    f"🎱 당첨 번호: [{numbers_str}]{bonus_str}\n"
-                    f"⏰ 업데이트 시각: {datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    f"📊 /result 명령어로 내 예측 번호와 당첨 결과를 확인해보세요!"
-                )
+def _fmt_line(idx: int, nums) -> str:
+    """번호 목록 한 줄 구성 (예: " 1. [1, 5, 12, 23, 34, 45]")"""
+    return f"{idx:2d}. [{_fmt_combo(nums)}]"
 
-                sent = await send_message_with_retry(
-                    bot, TELEGRAM_CHAT_ID, message
-                )
-                if not sent:
-                    logger.error("당첨번호 알림 발송 최종 실패")
-        else:
-            logger.warning("당첨번호 업데이트 실패 (미발표 또는 오류)")
-
-            # 재시도 가능하면 10분 후 재시도 스케줄 등록
-            if retry_count < max_retries:
-                next_retry = retry_count + 1
-                retry_minutes = 10
-                logger.info(f"{retry_minutes}분 후 재시도 예정 ({next_retry}/{max_retries})")
-
-                from datetime import timedelta
-                run_time = datetime.now(KST) + timedelta(minutes=retry_minutes)
-                scheduler.add_job(
-                    update_lottery_results,
-                    'date',
-                    run_date=run_time,
-                    args=[next_retry],
-                    id=f'lottery_update_retry_{next_retry}',
-                    name=f'당첨번호 업데이트 재시도 ({next_retry}/{max_retries})',
-                    replace_existing=True
-                )
 
+def _format_prediction_message(
+    title: str, timestamp: str, predictions: List, saved_count: int
+) -> str:
+    """예측 결과 메시지 구성 (/generate, 금요일 자동 생성 공용)
+
+    Args:
+        title: 메시지 제목 (예: "1150회 예측 결과")
+        timestamp: 생성 시각 문자열
+        predictions: LottoPrediction 리스트
+        saved_count: DB 저장에 성공한 개수
+
+    Returns:
+        텔레그램 전송용 메시지
+    """
+    header = (
+        f"🎰 {title}",
+        "",
+        f"⏰ 생성 시각: {timestamp}",
+        f"📊 생성 개수: {len(predictions)}개",
+        f"💾 저장 완료: {saved_count}개",
+        "",
+    )
+    lines = (
+        _fmt_line(idx, pred.combination)
+        for idx, pred in enumerate(predictions, 1)
+    )
+    return "\n".join(chain(header, lines))
+
+
+async def update_lottery_results():
+    """토요일 밤 9시 당첨번호 자동 업데이트 및 결과 알림
+
+    미발표 등으로 실패하면 작업 안에서 UPDATE_RETRY_MINUTES 간격으로
+    최대 UPDATE_MAX_RETRIES회 재시도한다.
+    """
+    total_attempts = UPDATE_MAX_RETRIES + 1
+    logger.info("당첨번호 자동 업데이트 시작")
+
+    bot = scheduled_bot
+
+    try:
+        for attempt in range(1, total_attempts + 1):
+            if await LotteryService.update_latest_draw():
+                break
+
+            logger.warning(
+                f"당첨번호 업데이트 실패 (시도 {attempt}/{total_attempts}, 미발표 또는 오류)"
+            )
+            if attempt == total_attempts:
                 fail_message = (
-                    f"⚠️ 당첨번호 업데이트 실패 (시도 {retry_count + 1}/{max_retries + 1})\n\n"
-                    f"아직 발표되지 않았거나 조회 중 오류가 발생했습니다.\n"
-                    f"{retry_minutes}분 후 재시도합니다."
+                    "❌ 당첨번호 업데이트 최종 실패\n\n"
+                    f"총 {total_attempts}회 시도했지만 실패했습니다.\n"
+                    "/update 명령어로 수동 업데이트해주세요."
                 )
                 await send_message_with_retry(bot, TELEGRAM_CHAT_ID, fail_message)
-            else:
+                return
+
+            # 재시도 안내는 첫 실패 때 한 번만 발송
+            if attempt == 1:
                 fail_message = (
-                    "❌ 당첨번호 업데이트 최종 실패\n\n"
-                    f"총 {max_retries + 1}회 시도했지만 실패했습니다.\n"
-                    "/update 명령어로 수동 업데이트해주세요."
+                    "⚠️ 당첨번호 업데이트 실패\n\n"
+                    "아직 발표되지 않았거나 조회 중 오류가 발생했습니다.\n"
+                    f"{UPDATE_RETRY_MINUTES}분 간격으로 최대 {UPDATE_MAX_RETRIES}회 재시도합니다."
                 )
                 await send_message_with_retry(bot, TELEGRAM_CHAT_ID, fail_message)
 
+            logger.info(f"{UPDATE_RETRY_MINUTES}분 후 재시도 예정 ({attempt}/{UPDATE_MAX_RETRIES})")
+            await asyncio.sleep(UPDATE_RETRY_MINUTES * 60)
+
+        logger.info("당첨번호 업데이트 성공")
+
+        last_draw = await cached_last_draw(refresh=True)
+        if last_draw:
+            await _sync_data_service(last_draw)
+
+            # 당첨번호 알림 발송 (보너스 번호 포함)
+            numbers = [last_draw[str(i)] for i in range(1, 7)]
+            numbers_str = _fmt_combo(numbers)
+            bonus = last_draw.get('bonus')
+            bonus_str = f"\n🎯 보너스 번호: {bonus}" if bonus else ""
+
+            message = (
+                f"🏆 {last_draw['no']}회 당첨번호 업데이트\n\n"
+                f"🎱 당첨 번호: [{numbers_str}]{bonus_str}\n"
+                f"⏰ 업데이트 시각: {_now_str()}\n\n"
+                f"📊 /result 명령어로 내 예측 번호와 당첨 결과를 확인해보세요!"
+            )
+
+            sent = await send_message_with_retry(
+                bot, TELEGRAM_CHAT_ID, message
+            )
+            if not sent:
+                logger.error("당첨번호 알림 발송 최종 실패")
+
     except Exception as e:
         logger.error(f"당첨번호 업데이트 중 오류: {e}", exc_info=True)
 
@@ -204,12 +417,12 @@ async def generate_weekly_predictions():
     """금요일 정오 자동 예측 생성 및 텔레그램 전송"""
     logger.info("주간 예측 자동 생성 시작")
 
-    bot = Bot(token=TELEGRAM_BOT_TOKEN)
+    bot = scheduled_bot
 
     try:
-        predictions = await prediction_service.generate_predictions(
-            num_predictions=10
-        )
+        # 다음 회차 조회가 뒤처진 데이터를 동기화하므로 예측 생성보다 먼저 수행
+        next_draw_no = await cached_next_draw_no()
+        predictions = await prediction_service.generate_predictions(num_predictions=10)
 
         if not predictions:
             logger.error("예측 생성 실패")
@@ -219,50 +432,32 @@ async def generate_weekly_predictions():
             )
             return
 
-        # 다음 회차 번호
-        last_draw = await AsyncLottoRepository.get_last_draw()
-        next_draw_no = last_draw['no'] + 1 if last_draw else 1
+        next_draw_no = next_draw_no or 1
 
         # DB 저장 — 자동생성분은 채팅방 소유자(TELEGRAM_CHAT_ID)에게 귀속시켜 /mylist에 노출
         # ponytail: TELEGRAM_CHAT_ID는 os.getenv 문자열이라 조회 쪽 int user_id와 맞추려면 int() 변환 필수
         owner_id = int(TELEGRAM_CHAT_ID) if TELEGRAM_CHAT_ID else None
-        saved_count = 0
-        for pred in predictions:
-            try:
-                success = await AsyncLottoRepository.save_recommendation(
-                    numbers=pred.combination,
-                    next_no=next_draw_no,
-                    user_id=owner_id
-                )
-                if success:
-                    saved_count += 1
-            except Exception as e:
-                logger.error(f"예측 저장 실패: {e}")
+        saved_count = await AsyncLottoRepository.save_recommendations_batch(
+            [pred.combination for pred in predictions], next_draw_no, user_id=owner_id
+        )
 
         logger.info(f"예측 생성 완료: {saved_count}/{len(predictions)}개 저장")
 
         # 메시지 구성
-        timestamp = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
-        message_lines = [
-            f"🎰 {next_draw_no}회 주간 예측",
-            "",
-            f"⏰ 생성 시각: {timestamp}",
-            f"📊 생성 개수: {len(predictions)}개",
-            f"💾 저장 완료: {saved_count}개",
-            ""
-        ]
-
-        for idx, pred in enumerate(predictions, 1):
-            numbers_str = ", ".join(str(n) for n in pred.combination)
-            message_lines.append(f"{idx:2d}. [{numbers_str}]")
-
-        message = "\n".join(message_lines)
+        timestamp = _now_str()
+        message = _format_prediction_message(
+            f"{next_draw_no}회 주간 예측", timestamp, predictions, saved_count
+        )
 
-        sent = await send_message_with_retry(bot, TELEGRAM_CHAT_ID, message)
-        if sent:
-            logger.info(f"주간 예측 텔레그램 발송 완료")
+        # 텔레그램 메시지 길이 제한(4096자) 대응 — 줄 단위로 나눠 순서대로 발송
+        # 중간이 빠진 메시지가 되지 않도록 한 조각이라도 실패하면 나머지는 보내지 않음
+        chunks = _split_message(message.split("\n"))
+        for index, chunk in enumerate(chunks, start=1):
+            if not await send_message_with_retry(bot, TELEGRAM_CHAT_ID, chunk):
+                logger.error(f"주간 예측 텔레그램 발송 최종 실패 ({index}/{len(chunks)}번째 조각)")
+                break
         else:
-            logger.error("주간 예측 텔레그램 발송 최종 실패")
+            logger.info(f"주간 예측 텔레그램 발송 완료")
 
     except Exception as e:
         logger.error(f"주간 예측 생성 중 오류: {e}", exc_info=True)
@@ -276,10 +471,9 @@ async def generate_weekly_predictions():
 async def send_monday_reminder():
     """월요일 오전 10시: 한 주 시작 알림"""
     logger.info("월요일 알림 발송")
-    bot = Bot(token=TELEGRAM_BOT_TOKEN)
+    bot = scheduled_bot
 
-    last_draw = await AsyncLottoRepository.get_last_draw()
-    next_draw_no = last_draw['no'] + 1 if last_draw else "?"
+    next_draw_no = await cached_next_draw_no() or "?"
 
     message = (
         f"🌅 한 주가 시작되었어요!\n\n"
@@ -294,7 +488,7 @@ async def send_monday_reminder():
 async def send_friday_purchase_reminder():
     """금요일 오후 4시: 구매 알림"""
     logger.info("금요일 구매 알림 발송")
-    bot = Bot(token=TELEGRAM_BOT_TOKEN)
+    bot = scheduled_bot
 
     message = (
         "🛒 이번주 토요일이 오기전에 로또 구매하러 갑시다!\n\n"
@@ -308,7 +502,7 @@ async def send_friday_purchase_reminder():
 async def send_saturday_purchase_reminder():
     """토요일 오후 6시: 마감 임박 알림"""
     logger.info("토요일 구매 마감 알림 발송")
-    bot = Bot(token=TELEGRAM_BOT_TOKEN)
+    bot = scheduled_bot
 
     message = (
         "🚨 아직 안늦었어요! 빨리 구매하러 갑시다!\n\n"
@@ -327,7 +521,11 @@ def setup_scheduler():
 
     from pytz import timezone as pytz_timezone
     kst = pytz_timezone('Asia/Seoul')
-    scheduler = AsyncIOScheduler(timezone=kst)
+    # 중복 실행 방지 + 지연된 작업도 1시간 이내면 한 번만 실행
+    scheduler = AsyncIOScheduler(
+        timezone=kst,
+        job_defaults={'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 3600},
+    )
 
     # 매주 월요일 오전 10시: 한 주 시작 알림
     scheduler.add_job(
@@ -412,9 +610,9 @@ def restricted(func):
             elif update.message:
                 await update.message.reply_text(
                     "⛔ 이 봇은 관리자 전용입니다.\n"
-                    f"당신의 user_id: `{uid}`\n\n"
+                    f"당신의 user_id: <code>{uid}</code>\n\n"
                     "관리자라면 이 값을 .env의 TELEGRAM_ADMIN_IDS에 추가하세요.",
-                    parse_mode="Markdown",
+                    parse_mode="HTML",
                 )
             return
         return await func(update, context, *args, **kwargs)
@@ -424,48 +622,13 @@ def restricted(func):
 @restricted
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """시작 명령어 핸들러"""
-    welcome_message = (
-        "🎰 로또 예측 봇 🎰\n\n"
-        "사용 가능한 명령어:\n"
-        "🔮 /generate - 5개 조합 생성 (기본)\n"
-        "🔮 /generate [개수] - 원하는 개수만큼 생성 (최대 20개)\n"
-        "📋 /mylist - 이번 회차 생성된 전체 번호 보기\n"
-        "🏆 /winning - 최신 회차 당첨 번호 확인\n"
-        "📊 /result - 내 예측과 당첨 번호 매칭 확인\n"
-        "📊 /result [회차] - 특정 회차 결과 확인\n"
-        "🔄 /update - 최신 당첨번호 수동 업데이트\n"
-        "❓ /help - 명령어 안내\n"
-        "🏠 /start - 시작 메시지 표시"
-    )
-    keyboard = [[InlineKeyboardButton("☕ 후원하기 (카카오페이)", url="https://qr.kakaopay.com/Ej74xpc815dc06149")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    await update.message.reply_text(welcome_message, reply_markup=reply_markup)
+    await update.message.reply_text(_WELCOME_MESSAGE, reply_markup=_DONATE_MARKUP)
 
 
 @restricted
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """도움말 명령어 핸들러"""
-    help_message = (
-        "📖 명령어 안내\n\n"
-        "🔮 예측 생성:\n"
-        "  /generate - 5개 조합 생성 (기본)\n"
-        "  /generate [개수] - 원하는 개수만큼 생성 (최대 20개)\n"
-        "  예: /generate 10\n\n"
-        "📋 내 번호 확인:\n"
-        "  /mylist - 이번 회차 생성된 전체 번호 보기\n\n"
-        "🏆 당첨 확인:\n"
-        "  /winning - 최신 회차 당첨 번호 확인\n"
-        "  /update - 최신 당첨번호 수동 업데이트\n\n"
-        "📊 결과 확인:\n"
-        "  /result - 내가 생성한 번호와 당첨 번호 매칭 확인\n"
-        "  /result [회차] - 특정 회차 결과 확인\n"
-        "  예: /result 1150\n\n"
-        "⚙️ 기타:\n"
-        "  /help - 이 메시지 표시\n"
-        "  /start - 시작 메시지 표시\n\n"
-        "⏰ 참고: 당첨 번호는 매주 토요일 밤 9시에 자동 업데이트됩니다."
-    )
-    await update.message.reply_text(help_message)
+    await update.message.reply_text(_HELP_MESSAGE)
 
 
 @restricted
@@ -487,57 +650,44 @@ async def generate_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 )
                 return
 
-        loading_msg = await update.message.reply_text(
-            f"🔮 {num_predictions}개 조합 생성 중..."
-        )
-
-        predictions = await prediction_service.generate_predictions(
-            num_predictions=num_predictions
-        )
-
-        # 다음 회차 번호
-        last_draw = await AsyncLottoRepository.get_last_draw()
-        next_draw_no = last_draw['no'] + 1 if last_draw else 1
-
-        # DB 저장 (사용자 ID 포함)
+        # 같은 사용자의 이전 요청이 끝나기 전이면 중복 생성하지 않음
         user_id = update.effective_user.id
-        saved_count = 0
-        for pred in predictions:
-            try:
-                success = await AsyncLottoRepository.save_recommendation(
-                    numbers=pred.combination,
-                    next_no=next_draw_no,
-                    user_id=user_id
-                )
-                if success:
-                    saved_count += 1
-            except Exception as e:
-                logger.error(f"예측 저장 실패: {e}")
+        if user_id in _generating_users:
+            await update.message.reply_text(
+                "⏳ 이전 요청을 처리 중입니다. 잠시 후 다시 시도해주세요."
+            )
+            return
+        _generating_users.add(user_id)
 
-        # 결과 메시지
-        timestamp = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
-        message_lines = [
-            f"🎰 {next_draw_no}회 예측 결과",
-            "",
-            f"⏰ 생성 시각: {timestamp}",
-            f"📊 생성 개수: {len(predictions)}개",
-            f"💾 저장 완료: {saved_count}개",
-            ""
-        ]
+        try:
+            # 로딩 메시지 전송과 다음 회차 조회(뒤처진 데이터 동기화 포함)를 동시에 진행한 뒤,
+            # 동기화된 데이터 기준으로 예측 생성
+            loading_msg, next_draw_no = await asyncio.gather(
+                update.message.reply_text(f"🔮 {num_predictions}개 조합 생성 중..."),
+                cached_next_draw_no(),
+            )
+            predictions = await prediction_service.generate_predictions(
+                num_predictions=num_predictions
+            )
+            next_draw_no = next_draw_no or 1
 
-        for idx, pred in enumerate(predictions, 1):
-            numbers_str = ", ".join(str(n) for n in pred.combination)
-            message_lines.append(f"{idx:2d}. [{numbers_str}]")
+            # DB 저장 (사용자 ID 포함)
+            saved_count = await AsyncLottoRepository.save_recommendations_batch(
+                [pred.combination for pred in predictions], next_draw_no, user_id=user_id
+            )
+        finally:
+            _generating_users.discard(user_id)
 
-        message = "\n".join(message_lines)
+        # 결과 메시지
+        timestamp = _now_str()
+        message = _format_prediction_message(
+            f"{next_draw_no}회 예측 결과", timestamp, predictions, saved_count
+        )
 
         await loading_msg.delete()
         await update.message.reply_text(message)
 
-        logger.info(
-            f"예측 생성 완료: {num_predictions}개, "
-            f"사용자: {update.effective_user.id}"
-        )
+        logger.info("예측 생성 완료: %d개, 사용자: %s", num_predictions, user_id)
 
     except Exception as e:
         logger.error(f"예측 생성 오류: {e}", exc_info=True)
@@ -551,13 +701,11 @@ async def mylist_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """이번 회차 생성된 전체 번호 조회 명령어 핸들러"""
     try:
         # 다음 회차 번호 계산
-        last_draw = await AsyncLottoRepository.get_last_draw()
-        if not last_draw:
+        next_draw_no = await cached_next_draw_no()
+        if next_draw_no is None:
             await update.message.reply_text("당첨 번호 정보를 찾을 수 없습니다.")
             return
 
-        next_draw_no = last_draw['no'] + 1
-
         # 해당 회차의 내 예측 번호 조회 (사용자별)
         user_id = update.effective_user.id
         predictions = await AsyncLottoRepository.get_recommendations_for_draw(
@@ -580,7 +728,6 @@ async def mylist_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         ]
 
         for idx, pred in enumerate(predictions, 1):
-            numbers_str = ", ".join(str(n) for n in pred['numbers'])
             # 생성 시각 포맷팅
             create_at = pred.get('create_at')
             if create_at:
@@ -591,17 +738,10 @@ async def mylist_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             else:
                 time_str = ""
 
-            message_lines.append(f"{idx:2d}. [{numbers_str}]  {time_str}")
+            message_lines.append(f"{_fmt_line(idx, pred['numbers'])}  {time_str}")
 
         # 텔레그램 메시지 길이 제한(4096자) 대응
-        message = "\n".join(message_lines)
-        if len(message) > 4000:
-            # 메시지를 분할 전송
-            chunks = _split_message(message_lines)
-            for chunk in chunks:
-                await update.message.reply_text(chunk)
-        else:
-            await update.message.reply_text(message)
+        await _reply_lines(update.message, message_lines)
 
     except Exception as e:
         logger.error(f"내 번호 조회 오류: {e}", exc_info=True)
@@ -620,25 +760,81 @@ def _split_message(lines: List[str], max_length: int = 4000) -> List[str]:
     Returns:
         분할된 메시지 리스트
     """
+    # 줄 단위로 채워 나가며 분할
     chunks = []
-    current_chunk = []
+    buf = io.StringIO()
     current_length = 0
 
     for line in lines:
         line_length = len(line) + 1  # +1 for newline
-        if current_length + line_length > max_length and current_chunk:
-            chunks.append("\n".join(current_chunk))
-            current_chunk = []
+        if current_length + line_length > max_length and current_length:
+            chunks.append(buf.getvalue())
+            buf = io.StringIO()
             current_length = 0
 
-        current_chunk.append(line)
+        if current_length:
+            buf.write("\n")
+        buf.write(line)
         current_length += line_length
 
-    if current_chunk:
-        chunks.append("\n".join(current_chunk))
+    if current_length:
+        chunks.append(buf.getvalue())
 
     return chunks
 
+
+async def _reply_lines(message, lines: List[str]):
+    """라인 목록을 길이 제한에 맞게 나눠 순서대로 답장
+
+    같은 채팅의 분할 메시지는 순서가 보장되어야 하므로 동시에 보내지 않는다.
+    짧은 메시지는 하나의 청크가 되어 한 번만 전송된다.
+    """
+    for chunk in _split_message(lines):
+        await message.reply_text(chunk)
+
+
+def _combo_mask(nums) -> int:
+    """번호 조합을 비트마스크로 변환 (n번 비트 = 번호 n, 1~45는 64비트 정수 하나에 들어감)"""
+    mask = 0
+    for n in nums:
+        mask |= 1 << n
+    return mask
+
+
+def _match_predictions(
+    combinations: List[List[int]], winning_numbers: List[int], bonus_number: Optional[int]
+) -> List[tuple]:
+    """예측 조합별 당첨 매칭 계산
+
+    당첨/보너스 번호를 비트마스크로 한 번만 만들고, 조합마다 AND + popcount로 일치 개수를 센다.
+
+    Returns:
+        (번호, 일치 개수, 보너스 일치 여부, 등수) 튜플 리스트 (입력 순서 유지)
+    """
+    winning_mask = _combo_mask(winning_numbers)
+    bonus_mask = 1 << bonus_number if bonus_number else 0
+    results = []
+    for numbers in combinations:
+        pred_mask = _combo_mask(numbers)
+        matches = (pred_mask & winning_mask).bit_count()
+        bonus_match = bool(pred_mask & bonus_mask)
+        results.append((numbers, matches, bonus_match, _determine_rank(matches, bonus_match)))
+    return results
+
+
+# (일치 개수, 보너스 일치 여부) → 등수 (표에 없으면 낙첨)
+_RANK_TABLE = {
+    (6, False): "1등", (6, True): "1등",
+    (5, True): "2등",
+    (5, False): "3등",
+    (4, False): "4등", (4, True): "4등",
+    (3, False): "5등", (3, True): "5등",
+}
+
+# 결과 정렬용 등수 순서
+_RANK_ORDER = {"1등": 1, "2등": 2, "3등": 3, "4등": 4, "5등": 5, "낙첨": 6}
+
+
 def _determine_rank(matches: int, bonus_match: bool) -> str:
     """로또 등수 판정
 
@@ -649,18 +845,7 @@ def _determine_rank(matches: int, bonus_match: bool) -> str:
     Returns:
         등수 문자열 (1등~5등 또는 낙첨)
     """
-    if matches == 6:
-        return "1등"
-    elif matches == 5 and bonus_match:
-        return "2등"
-    elif matches == 5:
-        return "3등"
-    elif matches == 4:
-        return "4등"
-    elif matches == 3:
-        return "5등"
-    else:
-        return "낙첨"
+    return _RANK_TABLE.get((matches, bonus_match), "낙첨")
 
 
 
@@ -668,7 +853,7 @@ def _determine_rank(matches: int, bonus_match: bool) -> str:
 async def check_winning_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """당첨 번호 확인 명령어 핸들러"""
     try:
-        last_draw = await AsyncLottoRepository.get_last_draw()
+        last_draw = await cached_last_draw()
 
         if not last_draw:
             await update.message.reply_text("당첨 번호 정보를 찾을 수 없습니다.")
@@ -684,7 +869,7 @@ async def check_winning_command(update: Update, context: ContextTypes.DEFAULT_TY
         else:
             draw_date_str = str(draw_date).split(' ')[0] + ' (토)'
 
-        numbers_str = ", ".join(str(n) for n in sorted(numbers))
+        numbers_str = _fmt_combo(numbers)
         bonus = last_draw.get('bonus')
         bonus_str = f"\n🎯 보너스 번호: {bonus}" if bonus else ""
 
@@ -713,11 +898,13 @@ async def update_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         success = await LotteryService.update_latest_draw()
 
         if success:
-            last_draw = await AsyncLottoRepository.get_last_draw()
+            last_draw = await cached_last_draw(refresh=True)
             if last_draw:
+                # 다음 회차 번호와 중복 검사가 새 회차 기준이 되도록 데이터 서비스도 갱신
+                await _sync_data_service(last_draw)
                 draw_no = last_draw['no']
                 numbers = [last_draw[str(i)] for i in range(1, 7)]
-                numbers_str = ", ".join(str(n) for n in sorted(numbers))
+                numbers_str = _fmt_combo(numbers)
                 bonus = last_draw.get('bonus')
                 bonus_str = f"\n🎯 보너스 번호: {bonus}" if bonus else ""
 
@@ -756,7 +943,7 @@ async def check_result_command(update: Update, context: ContextTypes.DEFAULT_TYP
 
         # 회차 번호가 없으면 최신 회차 사용
         if target_draw_no is None:
-            last_draw = await AsyncLottoRepository.get_last_draw()
+            last_draw = await cached_last_draw()
             if not last_draw:
                 await update.message.reply_text("당첨 번호 정보를 찾을 수 없습니다.")
                 return
@@ -764,8 +951,12 @@ async def check_result_command(update: Update, context: ContextTypes.DEFAULT_TYP
 
         draw_no = target_draw_no
 
-        # 당첨 번호 조회 (보너스 번호 포함)
-        winning_data = await _get_winning_numbers(draw_no)
+        # 당첨 번호(보너스 포함)와 내 예측 번호(사용자별) 동시 조회
+        user_id = update.effective_user.id
+        winning_data, my_predictions = await asyncio.gather(
+            _get_winning_numbers(draw_no),
+            AsyncLottoRepository.get_recommendations_for_draw(draw_no, user_id=user_id),
+        )
         if not winning_data:
             await update.message.reply_text(
                 f"{draw_no}회차 당첨 번호를 찾을 수 없습니다."
@@ -775,12 +966,6 @@ async def check_result_command(update: Update, context: ContextTypes.DEFAULT_TYP
         winning_numbers = winning_data["numbers"]
         bonus_number = winning_data["bonus"]
 
-        # 내 예측 번호 조회 (사용자별)
-        user_id = update.effective_user.id
-        my_predictions = await AsyncLottoRepository.get_recommendations_for_draw(
-            draw_no, user_id=user_id
-        )
-
         if not my_predictions:
             await update.message.reply_text(
                 f"{draw_no}회차에 생성한 예측이 없습니다."
@@ -788,20 +973,14 @@ async def check_result_command(update: Update, context: ContextTypes.DEFAULT_TYP
             return
 
         # 매칭 결과 계산 (보너스 번호 매칭 포함)
-        winning_set = set(winning_numbers)
-        results = []
-        for pred in my_predictions:
-            pred_numbers = set(pred['numbers'])
-            matches = len(pred_numbers & winning_set)
-            bonus_match = bonus_number in pred_numbers if bonus_number else False
-            rank = _determine_rank(matches, bonus_match)
-            results.append((pred['numbers'], matches, bonus_match, rank))
+        results = _match_predictions(
+            [pred['numbers'] for pred in my_predictions], winning_numbers, bonus_number
+        )
 
         # 등수 우선, 같은 등수면 매칭 수 내림차순
-        rank_order = {"1등": 1, "2등": 2, "3등": 3, "4등": 4, "5등": 5, "낙첨": 6}
-        results.sort(key=lambda x: (rank_order.get(x[3], 99), -x[1]))
+        results.sort(key=lambda x: (_RANK_ORDER.get(x[3], 99), -x[1]))
 
-        winning_str = ", ".join(str(n) for n in sorted(winning_numbers))
+        winning_str = _fmt_combo(winning_numbers)
         bonus_str = f" + 보너스: {bonus_number}" if bonus_number else ""
 
         message_lines = [
@@ -826,7 +1005,7 @@ async def check_result_command(update: Update, context: ContextTypes.DEFAULT_TYP
         message_lines.append("[상세 결과]")
         # 전체 결과 표시
         for idx, (numbers, matches, bonus_match, rank) in enumerate(results, 1):
-            numbers_str = ", ".join(str(n) for n in numbers)
+            numbers_str = _fmt_combo(numbers)
             if rank != "낙첨":
                 mark = "🏆" if rank in ("1등", "2등") else "✅"
                 bonus_info = " (보너스⭕)" if bonus_match and matches == 5 else ""
@@ -840,13 +1019,7 @@ async def check_result_command(update: Update, context: ContextTypes.DEFAULT_TYP
                 )
 
         # 텔레그램 메시지 길이 제한(4096자) 대응
-        message = "\n".join(message_lines)
-        if len(message) > 4000:
-            chunks = _split_message(message_lines)
-            for chunk in chunks:
-                await update.message.reply_text(chunk)
-        else:
-            await update.message.reply_text(message)
+        await _reply_lines(update.message, message_lines)
 
     except Exception as e:
         logger.error(f"결과 확인 오류: {e}", exc_info=True)
@@ -858,25 +1031,27 @@ async def check_result_command(update: Update, context: ContextTypes.DEFAULT_TYP
 async def _get_winning_numbers(draw_no: int) -> Optional[Dict[str, Any]]:
     """특정 회차의 당첨 번호 및 보너스 번호 조회
 
+    조회에 성공한 회차는 프로세스 내 캐시에 보관해 재조회 시 DB를 거치지 않는다.
+
     Returns:
         {"numbers": [1,2,3,4,5,6], "bonus": 7} 또는 None
     """
+    cached = _winning_cache.get(draw_no)
+    if cached is not None:
+        _winning_cache.move_to_end(draw_no)
+        return cached
+
     try:
-        from database.connector import AsyncDatabaseConnector
-        query = """
-        SELECT `1`, `2`, `3`, `4`, `5`, `6`, bonus
-        FROM result
-        WHERE no = %s
-        """
-        results = await AsyncDatabaseConnector.execute_query(
-            query, (draw_no,)
-        )
+        row = await AsyncLottoRepository.get_draw_by_no(draw_no)
 
-        if results and len(results) > 0:
-            row = results[0]
+        if row:
             numbers = [row[str(i)] for i in range(1, 7)]
             bonus = row.get('bonus')
-            return {"numbers": numbers, "bonus": bonus}
+            winning_data = {"numbers": numbers, "bonus": bonus}
+            _winning_cache[draw_no] = winning_data
+            if len(_winning_cache) > WINNING_CACHE_SIZE:
+                _winning_cache.popitem(last=False)
+            return winning_data
 
         return None
 
@@ -961,11 +1136,10 @@ async def buy_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         tickets = [{"mode": "auto", "numbers": []} for _ in range(count)]
         preview_lines = [f"{i+1}. 자동" for i in range(count)]
     else:
-        last_draw = await AsyncLottoRepository.get_last_draw()
-        if not last_draw:
+        next_no = await cached_next_draw_no()
+        if next_no is None:
             await update.message.reply_text("당첨 번호 정보를 찾을 수 없습니다.")
             return
-        next_no = last_draw["no"] + 1
         preds = await AsyncLottoRepository.get_recommendations_for_draw(
             next_no, user_id=update.effective_user.id
         )
@@ -978,7 +1152,7 @@ async def buy_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         chosen = preds[:5]  # 최대 5장
         tickets = [{"mode": "manual", "numbers": p["numbers"]} for p in chosen]
         preview_lines = [
-            f"{i+1}. [{', '.join(map(str, p['numbers']))}] 수동"
+            f"{i+1}. [{_fmt_combo(p['numbers'])}] 수동"
             for i, p in enumerate(chosen)
         ]
 
@@ -1090,20 +1264,7 @@ async def buylist_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 @restricted
 async def unknown_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """알 수 없는 명령어 핸들러"""
-    message = (
-        "❓ 알 수 없는 명령어입니다.\n\n"
-        "사용 가능한 명령어:\n"
-        "🔮 /generate - 예측 생성 (기본 5개)\n"
-        "🔮 /generate [개수] - 원하는 개수만큼 생성 (최대 20개)\n"
-        "📋 /mylist - 이번 회차 내 번호 보기\n"
-        "🏆 /winning - 당첨 번호 확인\n"
-        "🔄 /update - 최신 당첨번호 수동 업데이트\n"
-        "📊 /result - 내 예측과 당첨 번호 매칭 확인\n"
-        "📊 /result [회차] - 특정 회차 결과 확인\n"
-        "❓ /help - 명령어 안내\n"
-        "🏠 /start - 시작 메시지 표시"
-    )
-    await update.message.reply_text(message)
+    await update.message.reply_text(_UNKNOWN_MESSAGE)
 
 
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -1114,74 +1275,112 @@ async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
 
-def main():
-    """메인 함수"""
-    async def run_bot():
-        """Bot 실행 (비동기)"""
-        logger.info("서비스 초기화 중...")
-        await initialize_services()
-        logger.info("서비스 초기화 완료")
-
-        setup_scheduler()
-
-        application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
-
-        # 명령어 핸들러 등록
-        application.add_handler(CommandHandler("start", start_command))
-        application.add_handler(CommandHandler("help", help_command))
-        application.add_handler(CommandHandler("generate", generate_command))
-        application.add_handler(CommandHandler("mylist", mylist_command))
-        application.add_handler(CommandHandler("winning", check_winning_command))
-        application.add_handler(CommandHandler("result", check_result_command))
-        application.add_handler(CommandHandler("update", update_command))
-        application.add_handler(CommandHandler("balance", balance_command))
-        application.add_handler(CommandHandler("buy", buy_command))
-        application.add_handler(CommandHandler("buylist", buylist_command))
-        application.add_handler(CallbackQueryHandler(buy_callback, pattern="^buy_"))
-
-        # 알 수 없는 명령어 핸들러
-        application.add_handler(
-            MessageHandler(filters.COMMAND, unknown_command)
-        )
+def _bot_commands_hash(bot_id: int) -> str:
+    """봇 ID + 명령어 메뉴 해시 (봇이 바뀌거나 메뉴가 바뀌면 달라짐)"""
+    payload = repr((bot_id, [(c.command, c.description) for c in _BOT_COMMANDS]))
+    return hashlib.sha256(payload.encode()).hexdigest()
 
-        application.add_error_handler(error_handler)
 
-        logger.info("Bot이 준비되었습니다.")
+def _read_commands_hash() -> Optional[str]:
+    """마지막으로 등록한 명령어 메뉴 해시 읽기 (없거나 읽기 실패 시 None)"""
+    try:
+        return BOT_COMMANDS_HASH_FILE.read_text().strip()
+    except OSError:
+        return None
 
-        await application.initialize()
 
-        # 봇 명령어 메뉴 자동 등록
-        bot_commands = [
-            BotCommand("start", "시작 메시지 표시"),
-            BotCommand("generate", "예측 번호 생성"),
-            BotCommand("mylist", "이번 회차 내 번호 보기"),
-            BotCommand("winning", "당첨 번호 확인"),
-            BotCommand("result", "결과 확인"),
-            BotCommand("balance", "동행복권 예치금 조회"),
-            BotCommand("buy", "로또645 구매"),
-            BotCommand("buylist", "구매 내역 조회"),
-            BotCommand("help", "명령어 안내"),
-        ]
-        await application.bot.set_my_commands(bot_commands)
+def _write_commands_hash(commands_hash: str):
+    """등록한 명령어 메뉴 해시 저장 (실패해도 다음 시작 때 다시 등록할 뿐이므로 무시)"""
+    try:
+        BOT_COMMANDS_HASH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BOT_COMMANDS_HASH_FILE.write_text(commands_hash)
+    except OSError as e:
+        logger.warning(f"명령어 메뉴 해시 저장 실패: {e}")
+
+
+async def post_init(application: Application):
+    """Application 초기화 직후 실행 (서비스/스케줄러 준비, 명령어 메뉴 등록)"""
+    global scheduled_bot
+
+    # 스케줄 작업도 이미 초기화된 application.bot으로 발송
+    scheduled_bot = application.bot
+
+    logger.info("서비스 초기화 중...")
+    await initialize_services()
+    logger.info("서비스 초기화 완료")
+
+    setup_scheduler()
+
+    # 봇 명령어 메뉴 자동 등록 (이전 등록과 같으면 생략)
+    commands_hash = _bot_commands_hash(application.bot.id)
+    if _read_commands_hash() == commands_hash:
+        logger.info("봇 명령어 메뉴 변경 없음, 등록 생략")
+    else:
+        await application.bot.set_my_commands(_BOT_COMMANDS)
+        _write_commands_hash(commands_hash)
         logger.info("봇 명령어 메뉴 등록 완료")
 
-        await application.start()
-        await application.updater.start_polling(
-            allowed_updates=Update.ALL_TYPES
-        )
 
-        try:
-            await asyncio.Event().wait()
-        except (KeyboardInterrupt, SystemExit):
-            logger.info("Bot 종료 중...")
-        finally:
-            stop_scheduler()
-            await application.updater.stop()
-            await application.stop()
-            await application.shutdown()
+async def post_shutdown(application: Application):
+    """Application 종료 후 정리 (스케줄러 중지, HTTP 세션 종료)"""
+    logger.info("Bot 종료 중...")
+    stop_scheduler()
+    await LotteryService.close_session()
+
 
-    logger.info("Telegram Bot 시작...")
-    asyncio.run(run_bot())
+def main():
+    """메인 함수"""
+    application = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .concurrent_updates(True)
+        # 전송 한도(전체 초당 30건, 그룹 분당 20건) 아래로 미리 조절해 429 재시도를 예방
+        # 그래도 429(RetryAfter)를 받으면 지정된 시간만큼 기다려 최대 3회 자동 재시도
+        # (RetryAfter 재시도는 여기서만 수행 — send_message_with_retry는 다시 재시도하지 않음)
+        .rate_limiter(AIORateLimiter(
+            overall_max_rate=28, overall_time_period=1,
+            group_max_rate=19, group_time_period=60,
+            max_retries=3,
+        ))
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
+
+    # 명령어 핸들러 등록
+    application.add_handler(CommandHandler("start", start_command))
+    application.add_handler(CommandHandler("help", help_command))
+    application.add_handler(CommandHandler("generate", generate_command))
+    application.add_handler(CommandHandler("mylist", mylist_command))
+    application.add_handler(CommandHandler("winning", check_winning_command))
+    application.add_handler(CommandHandler("result", check_result_command))
+    application.add_handler(CommandHandler("update", update_command))
+    application.add_handler(CommandHandler("balance", balance_command))
+    application.add_handler(CommandHandler("buy", buy_command))
+    application.add_handler(CommandHandler("buylist", buylist_command))
+    application.add_handler(CallbackQueryHandler(buy_callback, pattern="^buy_"))
+
+    # 알 수 없는 명령어 핸들러
+    application.add_handler(
+        MessageHandler(filters.COMMAND, unknown_command)
+    )
+
+    application.add_error_handler(error_handler)
+
+    # 시그널 처리, 초기화/종료 순서는 run_webhook/run_polling이 관리
+    if TELEGRAM_WEBHOOK_URL:
+        logger.info(f"Telegram Bot 시작 (webhook: {TELEGRAM_WEBHOOK_URL})...")
+        application.run_webhook(
+            listen=TELEGRAM_WEBHOOK_LISTEN,
+            port=TELEGRAM_WEBHOOK_PORT,
+            url_path=urlparse(TELEGRAM_WEBHOOK_URL).path.lstrip("/"),
+            webhook_url=TELEGRAM_WEBHOOK_URL,
+            secret_token=TELEGRAM_WEBHOOK_SECRET,
+            allowed_updates=Update.ALL_TYPES,
+        )
+    else:
+        logger.info("Telegram Bot 시작 (polling)...")
+        application.run_polling(allowed_updates=Update.ALL_TYPES)
 
 
 if __name__ == "__main__":
@@ -7,15 +7,45 @@ import pytest
 import pytest_asyncio
 import asyncio
 from database.connector import AsyncDatabaseConnector
+from database.repositories.lotto_repository import AsyncLottoRepository
+from services.data_service import AsyncDataService
 
 
-@pytest_asyncio.fixture(scope="function", autouse=True)
+@pytest_asyncio.fixture(scope="module", loop_scope="module", autouse=True)
 async def reset_db_pool():
-    """각 테스트 전후로 데이터베이스 연결 풀을 초기화합니다."""
-    # 테스트 전: 기존 풀 정리
+    """모듈 전후로 데이터베이스 연결 풀을 초기화합니다.
+
+    모듈의 테스트는 하나의 이벤트 루프를 공유하므로 풀도 모듈 단위로 재사용합니다.
+    """
+    # 모듈 시작 전: 다른 이벤트 루프에서 만든 풀 정리
     await AsyncDatabaseConnector.close_pool()
     
     yield
     
-    # 테스트 후: 풀 정리
+    # 모듈 종료 후: 풀 정리
+    await AsyncDatabaseConnector.close_pool()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def last_draw():
+    """테스트 세션 동안 변하지 않는 최근 회차 행을 한 번만 조회합니다."""
+    row = await AsyncLottoRepository.get_last_draw()
+    # 풀은 이 fixture의 이벤트 루프에 묶이므로 테스트와 공유하지 않도록 닫음
     await AsyncDatabaseConnector.close_pool()
+    assert row is not None, "최근 회차 데이터를 가져올 수 없습니다"
+    return row
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def loaded_data_service(last_draw):
+    """최근 10개 회차를 로드한 AsyncDataService를 모듈 안에서 공유합니다.
+
+    같은 범위를 테스트마다 다시 조회하지 않도록 모듈당 한 번만 로드합니다.
+    """
+    service = AsyncDataService()
+    last_draw_no = last_draw['no']
+    await service.load_historical_data(
+        start_no=max(1, last_draw_no - 9), end_no=last_draw_no
+    )
+    return service
+
@@ -0,0 +1,20 @@
+"""Integration test helpers
+
+통합 테스트에서 공유하는 DB 정리 함수를 제공합니다.
+"""
+
+from database.connector import AsyncDatabaseConnector
+from database.repositories.lotto_repository import combinations_in_clause
+
+
+async def delete_recommendations(next_no, combinations):
+    """테스트로 저장한 예측 조합을 DELETE 한 번으로 정리합니다."""
+    if not combinations:
+        return
+    in_clause, in_params = combinations_in_clause(combinations)
+    query = f"""
+    DELETE FROM recommand
+    WHERE next_no = %s
+    AND {in_clause}
+    """
+    await AsyncDatabaseConnector.execute_query(query, (next_no, *in_params), fetch=False)
@@ -7,18 +7,20 @@ from database.repositories.lotto_repository import AsyncLottoRepository
 from services.data_service import AsyncDataService
 from utils.exceptions import DatabaseError, DataLoadError
 
+from tests.integration.helpers import delete_recommendations
+
 
 class TestDatabaseConnection:
     """데이터베이스 연결 테스트"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_connection_pool_creation(self):
         """연결 풀이 성공적으로 생성됨"""
         pool = await AsyncDatabaseConnector.get_pool()
         assert pool is not None
         assert not pool._closed
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_connection_pool_reuse(self):
         """연결 풀이 재사용됨 (싱글톤)"""
         pool1 = await AsyncDatabaseConnector.get_pool()
@@ -26,7 +28,7 @@ class TestDatabaseConnection:
         
         assert pool1 is pool2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_simple_query(self):
         """간단한 쿼리 실행"""
         result = await AsyncDatabaseConnector.execute_query("SELECT 1 as test")
@@ -39,7 +41,7 @@ class TestDatabaseConnection:
 class TestLottoRepository:
     """로또 리포지토리 통합 테스트"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_last_draw(self):
         """최근 회차 조회"""
         result = await AsyncLottoRepository.get_last_draw()
@@ -53,11 +55,9 @@ class TestLottoRepository:
             assert str(i) in result
             assert 1 <= result[str(i)] <= 45
 
-    @pytest.mark.asyncio
-    async def test_get_draws_by_range(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_draws_by_range(self, last_draw):
         """범위 조회"""
-        # 최근 회차 확인
-        last_draw = await AsyncLottoRepository.get_last_draw()
         last_no = last_draw['no']
         
         # 최근 5개 회차 조회
@@ -72,11 +72,9 @@ class TestLottoRepository:
         for i in range(len(results) - 1):
             assert results[i]['no'] < results[i + 1]['no']
 
-    @pytest.mark.asyncio
-    async def test_get_draws_by_range_with_no_end(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_draws_by_range_with_no_end(self, last_draw):
         """종료 회차 없이 조회 (최신까지)"""
-        # 최근 회차 확인
-        last_draw = await AsyncLottoRepository.get_last_draw()
         last_no = last_draw['no']
         
         # 최근 10개 회차부터 최신까지
@@ -89,11 +87,10 @@ class TestLottoRepository:
         # 마지막 결과가 최신 회차인지 확인
         assert results[-1]['no'] == last_no
 
-    @pytest.mark.asyncio
-    async def test_check_draw_exists(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_check_draw_exists(self, last_draw):
         """회차 존재 여부 확인"""
         # 최근 회차는 존재해야 함
-        last_draw = await AsyncLottoRepository.get_last_draw()
         exists = await AsyncLottoRepository.check_draw_exists(last_draw['no'])
         
         assert exists is True
@@ -101,20 +98,76 @@ class TestLottoRepository:
         # 미래 회차는 존재하지 않아야 함
         future_draw_no = last_draw['no'] + 1000
         not_exists = await AsyncLottoRepository.check_draw_exists(future_draw_no)
-        
+
         assert not_exists is False
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_draw_by_no(self, last_draw):
+        """특정 회차 당첨 번호 조회"""
+        draw = await AsyncLottoRepository.get_draw_by_no(last_draw['no'])
+        assert draw['no'] == last_draw['no']
+        assert 'bonus' in draw
+
+        # 미래 회차는 None
+        assert await AsyncLottoRepository.get_draw_by_no(last_draw['no'] + 1000) is None
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_count_recommendations_in(self, last_draw):
+        """저장된 조합 포함 개수 조회"""
+        next_no = last_draw['no'] + 1
+        saved = [[3, 9, 17, 25, 33, 41]]
+        not_saved = [[2, 10, 18, 26, 34, 44]]
+
+        try:
+            await AsyncLottoRepository.save_recommendations_batch(saved, next_no)
+
+            # 순서와 무관하게 저장된 조합만 센다
+            found = await AsyncLottoRepository.count_recommendations_in(
+                next_no, [list(reversed(saved[0]))] + not_saved
+            )
+            assert found == 1
+            assert await AsyncLottoRepository.count_recommendations_in(next_no, []) == 0
+        finally:
+            await delete_recommendations(next_no, saved)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_save_recommendations_batch(self, last_draw):
+        """예측 결과 일괄 저장"""
+        next_no = last_draw['no'] + 1
+        test_user_id = 999999999  # 테스트 전용 사용자 ID
+        combinations = [
+            [42, 7, 14, 21, 28, 35],
+            [8, 15, 22, 29, 36, 43],
+        ]
+
+        try:
+            saved = await AsyncLottoRepository.save_recommendations_batch(
+                combinations, next_no, user_id=test_user_id
+            )
+            assert saved == len(combinations)
+
+            rows = await AsyncLottoRepository.get_recommendations_for_draw(
+                next_no, user_id=test_user_id
+            )
+            assert sorted(r['numbers'] for r in rows) == sorted(sorted(c) for c in combinations)
+        finally:
+            # 테스트 데이터 정리
+            await AsyncDatabaseConnector.execute_query(
+                "DELETE FROM recommand WHERE next_no = %s AND user_id = %s",
+                (next_no, test_user_id),
+                fetch=False
+            )
+
 
 class TestDataServiceIntegration:
     """DataService 통합 테스트"""
 
-    @pytest.mark.asyncio
-    async def test_load_historical_data(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_load_historical_data(self, last_draw):
         """역대 데이터 로드"""
         service = AsyncDataService()
         
         # 최근 10개 회차 로드
-        last_draw = await AsyncLottoRepository.get_last_draw()
         start_no = max(1, last_draw['no'] - 9)
         
         success = await service.load_historical_data(start_no=start_no)
@@ -124,15 +177,10 @@ class TestDataServiceIntegration:
         assert len(service.existing_combinations) > 0
         assert len(service.draws) == len(service.existing_combinations)
 
-    @pytest.mark.asyncio
-    async def test_get_all_winning_combinations_from_db(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_all_winning_combinations_from_db(self, loaded_data_service):
         """데이터베이스에서 당첨 조합 조회"""
-        service = AsyncDataService()
-        
-        # 데이터 로드
-        last_draw = await AsyncLottoRepository.get_last_draw()
-        start_no = max(1, last_draw['no'] - 4)
-        await service.load_historical_data(start_no=start_no)
+        service = loaded_data_service
         
         # 조합 조회
         combinations = await service.get_all_winning_combinations()
@@ -142,58 +190,37 @@ class TestDataServiceIntegration:
         assert all(all(1 <= n <= 45 for n in combo) for combo in combinations)
         assert all(combo == sorted(combo) for combo in combinations)
 
-    @pytest.mark.asyncio
-    async def test_save_and_verify_prediction(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_save_and_verify_prediction(self, loaded_data_service):
         """예측 저장 및 검증"""
-        service = AsyncDataService()
-        
-        # 데이터 로드
-        last_draw = await AsyncLottoRepository.get_last_draw()
-        await service.load_historical_data(start_no=max(1, last_draw['no'] - 4))
+        service = loaded_data_service
         
         # 테스트용 조합 생성 (기존 당첨 번호와 다른 조합)
         test_combination = [1, 2, 3, 4, 5, 6]
+        next_no = service.get_next_draw_no()
         
         # 저장
         try:
             saved_id = await service.save_prediction(test_combination)
             assert saved_id > 0 or saved_id == -1  # -1은 ID 조회 실패 (저장은 성공)
             
-            # 저장된 데이터 확인
-            next_no = last_draw['no'] + 1
-            saved_predictions = await AsyncLottoRepository.get_recommendations_for_draw(next_no)
-            
             # 방금 저장한 조합이 포함되어 있는지 확인
-            saved_numbers = [pred['numbers'] for pred in saved_predictions]
-            assert any(sorted(nums) == sorted(test_combination) for nums in saved_numbers)
+            found = await AsyncLottoRepository.count_recommendations_in(next_no, [test_combination])
+            assert found == 1
             
         finally:
             # 테스트 데이터 정리
-            cleanup_query = """
-            DELETE FROM recommand 
-            WHERE next_no = %s 
-            AND `1` = %s AND `2` = %s AND `3` = %s 
-            AND `4` = %s AND `5` = %s AND `6` = %s
-            """
-            sorted_combo = sorted(test_combination)
-            await AsyncDatabaseConnector.execute_query(
-                cleanup_query,
-                (next_no, *sorted_combo),
-                fetch=False
-            )
+            await delete_recommendations(next_no, [test_combination])
 
 
 class TestTransactions:
     """트랜잭션 테스트"""
 
-    @pytest.mark.asyncio
-    async def test_multiple_inserts_in_sequence(self):
-        """순차적 다중 삽입"""
-        service = AsyncDataService()
-        
-        # 데이터 로드
-        last_draw = await AsyncLottoRepository.get_last_draw()
-        await service.load_historical_data(start_no=max(1, last_draw['no'] - 4))
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_multiple_inserts_in_sequence(self, loaded_data_service):
+        """다중 삽입 (개별 INSERT를 순서대로 실행)"""
+        service = loaded_data_service
+        next_no = service.get_next_draw_no()
         
         # 여러 조합 저장
         test_combinations = [
@@ -202,43 +229,31 @@ class TestTransactions:
             [9, 16, 23, 30, 37, 44],
         ]
         
-        saved_ids = []
         try:
-            for combo in test_combinations:
-                saved_id = await service.save_prediction(combo)
-                saved_ids.append(saved_id)
+            # 일괄 저장(test_save_recommendations_batch)과 달리 한 건씩 저장
+            for combination in test_combinations:
+                saved_id = await service.save_prediction(combination)
+                assert saved_id > 0 or saved_id == -1  # -1은 ID 조회 실패 (저장은 성공)
             
             # 모두 저장되었는지 확인
-            assert len(saved_ids) == len(test_combinations)
+            found = await AsyncLottoRepository.count_recommendations_in(next_no, test_combinations)
+            assert found == len(test_combinations)
             
         finally:
             # 테스트 데이터 정리
-            next_no = last_draw['no'] + 1
-            for combo in test_combinations:
-                cleanup_query = """
-                DELETE FROM recommand 
-                WHERE next_no = %s 
-                AND `1` = %s AND `2` = %s AND `3` = %s 
-                AND `4` = %s AND `5` = %s AND `6` = %s
-                """
-                sorted_combo = sorted(combo)
-                await AsyncDatabaseConnector.execute_query(
-                    cleanup_query,
-                    (next_no, *sorted_combo),
-                    fetch=False
-                )
-
-    @pytest.mark.asyncio
+            await delete_recommendations(next_no, test_combinations)
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_concurrent_queries(self):
         """동시 쿼리 실행"""
-        # 여러 쿼리를 동시에 실행
-        tasks = [
-            AsyncDatabaseConnector.execute_query("SELECT 1 as test"),
-            AsyncDatabaseConnector.execute_query("SELECT 2 as test"),
-            AsyncDatabaseConnector.execute_query("SELECT 3 as test"),
-        ]
+        # 여러 쿼리를 동시에 실행 (하나라도 실패하면 나머지를 취소하고 예외 전파)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(AsyncDatabaseConnector.execute_query(f"SELECT {i} as test"))
+                for i in (1, 2, 3)
+            ]
         
-        results = await asyncio.gather(*tasks)
+        results = [task.result() for task in tasks]
         
         assert len(results) == 3
         assert results[0][0]['test'] == 1
@@ -249,13 +264,13 @@ class TestTransactions:
 class TestErrorHandling:
     """에러 처리 통합 테스트"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalid_query_handling(self):
         """잘못된 쿼리 처리"""
         with pytest.raises(DatabaseError):
             await AsyncDatabaseConnector.execute_query("SELECT * FROM nonexistent_table")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalid_draw_range(self):
         """잘못된 회차 범위 처리"""
         service = AsyncDataService()
@@ -268,7 +283,7 @@ class TestErrorHandling:
         with pytest.raises(Exception):
             await service.load_historical_data(start_no=100, end_no=50)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_connection_recovery(self):
         """연결 복구 테스트"""
         # 정상 쿼리 실행
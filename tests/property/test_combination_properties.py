@@ -6,10 +6,23 @@ Property-Based Testing을 사용하여 RandomGenerator의 보편적 속성을 
 Feature: lotto-algorithm-simplification
 """
 
+from collections import Counter
+
 import pytest
 from hypothesis import given, settings, strategies as st
 from services.random_generator import RandomGenerator
 
+# 여러 테스트가 공유하는 전략 (모듈 로드 시 한 번만 생성)
+ITERATIONS = st.integers(min_value=1, max_value=100)
+# 예제 하나에서 생성해 검증할 조합 수 (예제당 Hypothesis 오버헤드를 여러 조합에 분산)
+BATCH_SIZES = st.integers(min_value=50, max_value=200)
+SIX_UNIQUE = st.lists(
+    st.integers(min_value=1, max_value=45),
+    min_size=6,
+    max_size=6,
+    unique=True
+)
+
 
 class TestCombinationProperties:
     """조합 생성 속성 테스트"""
@@ -18,9 +31,9 @@ class TestCombinationProperties:
         """각 테스트 전에 실행"""
         self.generator = RandomGenerator()
     
-    @settings(max_examples=100)
-    @given(st.integers(min_value=1, max_value=100))
-    def test_property_1_valid_combination_generation(self, iterations):
+    @settings(max_examples=5)
+    @given(BATCH_SIZES)
+    def test_property_1_valid_combination_generation(self, batch_size):
         """
         Feature: lotto-algorithm-simplification, Property 1: Valid Combination Generation
         
@@ -33,24 +46,27 @@ class TestCombinationProperties:
         - 정확히 6개의 숫자
         - 모든 숫자가 1-45 범위 내
         - 모든 숫자가 고유함 (중복 없음)
-        """
-        combination = self.generator.generate_combination()
-        
-        # 정확히 6개
-        assert len(combination) == 6, \
-            f"조합은 정확히 6개의 숫자를 포함해야 합니다. 실제: {len(combination)}"
-        
-        # 모두 고유
-        assert len(set(combination)) == 6, \
-            f"모든 숫자는 고유해야 합니다. 중복 발견: {combination}"
         
-        # 범위 내
-        assert all(1 <= num <= 45 for num in combination), \
-            f"모든 숫자는 1-45 범위 내에 있어야 합니다. 실제: {combination}"
+        예제마다 batch_size개를 한 번에 생성해 검증합니다 (5개 예제로 250~1000개 조합).
+        """
+        combinations = [self.generator.generate_combination() for _ in range(batch_size)]
+        
+        for combination in combinations:
+            # 정확히 6개
+            assert len(combination) == 6, \
+                f"조합은 정확히 6개의 숫자를 포함해야 합니다. 실제: {len(combination)}"
+            
+            # 모두 고유
+            assert len(set(combination)) == 6, \
+                f"모든 숫자는 고유해야 합니다. 중복 발견: {combination}"
+            
+            # 범위 내
+            assert all(1 <= num <= 45 for num in combination), \
+                f"모든 숫자는 1-45 범위 내에 있어야 합니다. 실제: {combination}"
     
-    @settings(max_examples=100)
-    @given(st.integers(min_value=1, max_value=100))
-    def test_property_2_sorted_combination_output(self, iterations):
+    @settings(max_examples=5)
+    @given(BATCH_SIZES)
+    def test_property_2_sorted_combination_output(self, batch_size):
         """
         Feature: lotto-algorithm-simplification, Property 2: Sorted Combination Output
         
@@ -60,20 +76,22 @@ class TestCombinationProperties:
         (n1 < n2 < n3 < n4 < n5 < n6).
         
         이 속성은 생성된 모든 조합이 오름차순으로 정렬되어 있는지 검증합니다.
+        예제마다 batch_size개를 한 번에 생성해 검증합니다.
         """
-        combination = self.generator.generate_combination()
-        
-        # 오름차순 정렬 확인
-        assert combination == sorted(combination), \
-            f"조합은 오름차순으로 정렬되어야 합니다. 실제: {combination}, 정렬: {sorted(combination)}"
-        
-        # 엄격한 오름차순 (중복 없음) 확인
-        for i in range(5):
-            assert combination[i] < combination[i + 1], \
-                f"각 숫자는 다음 숫자보다 작아야 합니다. 위치 {i}: {combination[i]} >= {combination[i + 1]}"
+        combinations = [self.generator.generate_combination() for _ in range(batch_size)]
+        
+        for combination in combinations:
+            # 오름차순 정렬 확인
+            assert combination == sorted(combination), \
+                f"조합은 오름차순으로 정렬되어야 합니다. 실제: {combination}, 정렬: {sorted(combination)}"
+            
+            # 엄격한 오름차순 (중복 없음) 확인
+            for i in range(5):
+                assert combination[i] < combination[i + 1], \
+                    f"각 숫자는 다음 숫자보다 작아야 합니다. 위치 {i}: {combination[i]} >= {combination[i + 1]}"
     
     @settings(max_examples=100)
-    @given(st.integers(min_value=1, max_value=100))
+    @given(ITERATIONS)
     def test_property_12_extreme_pattern_filtering(self, iterations):
         """
         Feature: lotto-algorithm-simplification, Property 12: Extreme Pattern Filtering
@@ -127,16 +145,11 @@ class TestCombinationProperties:
             f"홀수와 짝수가 혼합되어야 합니다. 홀수 개수: {odd_count}, 조합: {combination}"
         
         # 5. 구간 분포 (한 구간에 5개 이상 몰리지 않음)
-        ranges = {
-            "1-10": sum(1 for n in combination if 1 <= n <= 10),
-            "11-20": sum(1 for n in combination if 11 <= n <= 20),
-            "21-30": sum(1 for n in combination if 21 <= n <= 30),
-            "31-40": sum(1 for n in combination if 31 <= n <= 40),
-            "41-45": sum(1 for n in combination if 41 <= n <= 45),
-        }
+        #    구간 인덱스: 0=1-10, 1=11-20, 2=21-30, 3=31-40, 4=41-45 (한 번의 순회로 집계)
+        ranges = Counter(min((n - 1) // 10, 4) for n in combination)
         max_in_range = max(ranges.values())
         assert max_in_range < 5, \
-            f"한 구간에 5개 이상 몰리면 안 됩니다. 구간 분포: {ranges}, 조합: {combination}"
+            f"한 구간에 5개 이상 몰리면 안 됩니다. 구간 분포: {dict(ranges)}, 조합: {combination}"
 
 
 class TestCombinationDiversity:
@@ -175,14 +188,7 @@ class TestExtremePatternDetection:
         self.generator = RandomGenerator()
     
     @settings(max_examples=100)
-    @given(
-        st.lists(
-            st.integers(min_value=1, max_value=45),
-            min_size=6,
-            max_size=6,
-            unique=True
-        )
-    )
+    @given(SIX_UNIQUE)
     def test_property_extreme_pattern_consistency(self, numbers):
         """
         극단적 패턴 감지 일관성 속성
@@ -202,15 +208,8 @@ class TestExtremePatternDetection:
             f"동일한 조합에 대해 일관된 결과를 반환해야 합니다. 조합: {sorted_numbers}"
     
     @settings(max_examples=100)
-    @given(
-        st.lists(
-            st.integers(min_value=1, max_value=45),
-            min_size=6,
-            max_size=6,
-            unique=True
-        )
-    )
-    def test_property_order_independence(self, numbers):
+    @given(SIX_UNIQUE, st.data())
+    def test_property_order_independence(self, numbers, data):
         """
         순서 독립성 속성
         
@@ -224,9 +223,9 @@ class TestExtremePatternDetection:
         sorted_numbers = sorted(numbers)
         result2 = self.generator.is_extreme_pattern(sorted_numbers)
         
-        # 역순
-        reversed_numbers = sorted(numbers, reverse=True)
-        result3 = self.generator.is_extreme_pattern(reversed_numbers)
+        # 임의의 순열 (역순 등 정렬/원본 외의 순서를 Hypothesis가 탐색)
+        permuted_numbers = data.draw(st.permutations(numbers), label="permuted_numbers")
+        result3 = self.generator.is_extreme_pattern(permuted_numbers)
         
         assert result1 == result2 == result3, \
-            f"순서에 관계없이 동일한 결과를 반환해야 합니다. 숫자: {numbers}"
+            f"순서에 관계없이 동일한 결과를 반환해야 합니다. 숫자: {numbers}, 순열: {permuted_numbers}"
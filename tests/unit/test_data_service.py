@@ -1,4 +1,5 @@
 # tests/unit/test_data_service.py
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from services.data_service import AsyncDataService
@@ -297,3 +298,111 @@ class TestErrorHandling:
         
         # Then
         assert "당첨 조합 조회 중 오류" in caplog.text
+
+
+class TestAppendDraw:
+    """증분 회차 추가 테스트"""
+
+    @staticmethod
+    def _row(no, numbers):
+        row = {'no': no, 'create_at': datetime.now()}
+        row.update({str(i): n for i, n in enumerate(numbers, 1)})
+        return row
+
+    def test_appends_next_draw(self, data_service, sample_draws):
+        """다음 회차가 추가되고 기존 조합 집합이 갱신됨"""
+        # Given
+        data_service.draws = list(sample_draws)
+        data_service.existing_combinations = {d.get_numbers_tuple() for d in sample_draws}
+        combinations = data_service.existing_combinations
+
+        # When
+        result = data_service.append_draw(self._row(4, [19, 20, 21, 22, 23, 24]))
+
+        # Then
+        assert result is True
+        assert data_service.get_last_draw().draw_no == 4
+        assert (19, 20, 21, 22, 23, 24) in combinations  # 같은 집합 객체가 갱신됨
+
+    def test_evicts_oldest_beyond_window(self, data_service, sample_draws):
+        """보유 회차 수를 넘으면 가장 오래된 회차 제거"""
+        # Given
+        data_service.draws = list(sample_draws)
+        data_service.existing_combinations = {d.get_numbers_tuple() for d in sample_draws}
+
+        # When
+        data_service.append_draw(self._row(4, [19, 20, 21, 22, 23, 24]), max_draws=3)
+
+        # Then
+        assert [d.draw_no for d in data_service.draws] == [2, 3, 4]
+        assert (1, 2, 3, 4, 5, 6) not in data_service.existing_combinations
+
+    def test_ignores_already_loaded_draw(self, data_service, sample_draws):
+        """이미 로드된 회차는 중복 추가하지 않음"""
+        # Given
+        data_service.draws = list(sample_draws)
+
+        # When
+        result = data_service.append_draw(self._row(3, [13, 14, 15, 16, 17, 18]))
+
+        # Then
+        assert result is True
+        assert len(data_service.draws) == 3
+
+    def test_rejects_non_consecutive_draw(self, data_service, sample_draws):
+        """연속되지 않는 회차는 거부 (전체 재로딩 필요)"""
+        # Given
+        data_service.draws = list(sample_draws)
+
+        # When
+        result = data_service.append_draw(self._row(5, [19, 20, 21, 22, 23, 24]))
+
+        # Then
+        assert result is False
+        assert data_service.get_last_draw().draw_no == 3
+
+
+class TestGetNextDrawNo:
+    """다음 회차 번호 테스트"""
+
+    def test_returns_last_draw_plus_one(self, data_service, sample_draws):
+        """마지막 회차 다음 번호 반환"""
+        data_service.draws = list(sample_draws)
+        assert data_service.get_next_draw_no() == 4
+
+    def test_returns_none_when_not_loaded(self, data_service):
+        """로드된 데이터가 없으면 None"""
+        assert data_service.get_next_draw_no() is None
+
+
+class TestLoadHistoricalDataLock:
+    """재로딩 직렬화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reloads_run_one_at_a_time(self, data_service):
+        """동시에 호출된 재로딩이 겹치지 않고 순서대로 실행됨"""
+        # Given
+        running = 0
+        max_running = 0
+        row = {'no': 1, 'create_at': datetime.now()}
+        row.update({str(i): i for i in range(1, 7)})
+
+        async def slow_fetch(start_no, end_no):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [row]
+
+        with patch('services.data_service.AsyncLottoRepository.get_draws_by_range',
+                   new=AsyncMock(side_effect=slow_fetch)):
+            # When
+            results = await asyncio.gather(
+                data_service.load_historical_data(start_no=1, end_no=1),
+                data_service.load_historical_data(start_no=1, end_no=1),
+            )
+
+        # Then
+        assert results == [True, True]
+        assert max_running == 1
@@ -0,0 +1,52 @@
+"""LotteryService 단위 테스트"""
+import asyncio
+
+import pytest
+
+from services.lottery_service import LotteryService
+
+
+@pytest.fixture
+def fresh_session():
+    """테스트 전후로 공유 세션 상태 초기화"""
+    LotteryService._session = None
+    LotteryService._session_loop = None
+    yield
+    LotteryService._session = None
+    LotteryService._session_loop = None
+
+
+class TestSharedSession:
+    """공유 HTTP 세션 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_session_in_same_loop(self, fresh_session):
+        """같은 이벤트 루프에서는 세션을 재사용하고, 종료 후에는 비움"""
+        # When
+        first = LotteryService._get_session()
+        second = LotteryService._get_session()
+        await LotteryService.close_session()
+
+        # Then
+        assert first is second
+        assert first.closed
+        assert LotteryService._session is None
+
+    def test_rebinds_session_for_new_loop(self, fresh_session):
+        """다른 이벤트 루프에서는 이전 루프의 세션을 쓰지 않고 새로 생성"""
+        # Given
+        async def get_and_keep():
+            return LotteryService._get_session()
+
+        async def get_and_close():
+            session = LotteryService._get_session()
+            await LotteryService.close_session()
+            return session
+
+        # When
+        stale = asyncio.run(get_and_keep())
+        fresh = asyncio.run(get_and_close())
+
+        # Then
+        assert fresh is not stale
+        assert fresh.closed
@@ -0,0 +1,453 @@
+"""Telegram Bot 핸들러 헬퍼 단위 테스트"""
+import pytest
+from collections import OrderedDict
+from unittest.mock import AsyncMock, MagicMock, patch
+from telegram.error import Forbidden, NetworkError, RetryAfter
+
+import telegram_bot_handler
+from telegram_bot_handler import (
+    send_message_with_retry, _combo_mask, _determine_rank, _fmt_combo, _fmt_line,
+    _match_predictions, _split_message,
+)
+
+
+class TestFormatting:
+    """번호 포맷팅 테스트"""
+
+    def test_fmt_combo(self):
+        """조합을 쉼표로 구분된 문자열로 변환"""
+        assert _fmt_combo([1, 5, 12, 23, 34, 45]) == "1, 5, 12, 23, 34, 45"
+
+    def test_fmt_combo_other_lengths(self):
+        """6개가 아닌 조합도 같은 형식으로 변환"""
+        assert _fmt_combo((3, 7)) == "3, 7"
+
+    def test_fmt_line_pads_index(self):
+        """인덱스를 두 자리로 맞춤"""
+        assert _fmt_line(3, [1, 2, 3, 4, 5, 6]) == " 3. [1, 2, 3, 4, 5, 6]"
+
+
+class TestSplitMessage:
+    """메시지 분할 테스트"""
+
+    def test_short_message_is_single_chunk(self):
+        """제한 이내면 하나의 메시지로 반환"""
+        # Given
+        lines = ["첫 줄", "", "셋째 줄"]
+
+        # When
+        chunks = _split_message(lines)
+
+        # Then
+        assert chunks == ["첫 줄\n\n셋째 줄"]
+
+    def test_splits_on_line_boundaries(self):
+        """제한을 넘으면 줄 단위로 분할"""
+        # Given
+        lines = [f"{i:03d}" + "x" * 16 for i in range(100)]  # 줄당 20자 + 개행
+
+        # When
+        chunks = _split_message(lines, max_length=100)
+
+        # Then
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert "\n".join(chunks) == "\n".join(lines)
+
+    def test_uneven_lines_are_packed_greedily(self):
+        """줄 길이가 고르지 않아도 줄 단위로 채워 최소 개수로 분할"""
+        # Given
+        lines = ["x" * 60] + ["y" * 9] * 20  # 긴 줄 하나 + 짧은 줄 여러 개
+
+        # When
+        chunks = _split_message(lines, max_length=100)
+
+        # Then
+        assert len(chunks) == 3
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert "\n".join(chunks) == "\n".join(lines)
+
+    def test_preserves_trailing_empty_line(self):
+        """마지막 빈 줄도 그대로 유지"""
+        assert _split_message(["a", ""]) == ["a\n"]
+
+    def test_empty_lines(self):
+        """빈 입력은 빈 리스트 반환"""
+        assert _split_message([]) == []
+
+
+class TestComboMask:
+    """비트마스크 매칭 테스트"""
+
+    def test_popcount_equals_common_numbers(self):
+        """마스크 AND의 비트 수가 일치 개수와 같음"""
+        # Given
+        winning = [3, 11, 19, 27, 38, 45]
+        pred = [1, 3, 19, 27, 40, 45]
+
+        # When
+        matches = (_combo_mask(pred) & _combo_mask(winning)).bit_count()
+
+        # Then
+        assert matches == len(set(pred) & set(winning))
+
+    def test_sets_one_bit_per_number(self):
+        """번호마다 해당 비트 하나만 설정"""
+        assert _combo_mask([1, 45]) == (1 << 1) | (1 << 45)
+
+    def test_match_predictions_ranks_each_combination(self):
+        """조합별 일치 개수, 보너스 여부, 등수를 입력 순서대로 반환"""
+        # Given
+        winning = [1, 2, 3, 4, 5, 6]
+        combinations = [
+            [1, 2, 3, 4, 5, 6],
+            [1, 2, 3, 4, 5, 7],
+            [1, 2, 3, 40, 41, 42],
+            [10, 11, 12, 13, 14, 15],
+        ]
+
+        # When
+        results = _match_predictions(combinations, winning, bonus_number=7)
+
+        # Then
+        assert [r[1:] for r in results] == [
+            (6, False, "1등"),
+            (5, True, "2등"),
+            (3, False, "5등"),
+            (0, False, "낙첨"),
+        ]
+
+
+class TestSendMessageWithRetry:
+    """메시지 발송 재시도 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_forbidden(self):
+        """차단된 채팅은 재시도 없이 실패 반환"""
+        # Given
+        bot = AsyncMock()
+        bot.send_message.side_effect = Forbidden("bot was blocked by the user")
+
+        # When
+        with patch('telegram_bot_handler.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            sent = await send_message_with_retry(bot, "1", "hello")
+
+        # Then
+        assert sent is False
+        assert bot.send_message.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_flood_control(self):
+        """RetryAfter는 레이트 리미터가 이미 재시도했으므로 다시 재시도하지 않음"""
+        # Given
+        bot = AsyncMock()
+        bot.send_message.side_effect = [RetryAfter(5), None]
+
+        # When
+        with patch('telegram_bot_handler.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            sent = await send_message_with_retry(bot, "1", "hello")
+
+        # Then
+        assert sent is False
+        assert bot.send_message.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_backoff_is_capped(self):
+        """지터 백오프가 최대 대기 시간을 넘지 않음"""
+        # Given
+        bot = AsyncMock()
+        bot.send_message.side_effect = NetworkError("timeout")
+
+        # When
+        with patch('telegram_bot_handler.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            sent = await send_message_with_retry(bot, "1", "hello", max_retries=5)
+
+        # Then
+        assert sent is False
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 4
+        assert all(10 <= d <= 60 for d in delays)
+
+
+class TestUpdateLotteryResults:
+    """당첨번호 자동 업데이트 재시도 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_retries_in_place_and_notifies_once(self):
+        """실패 시 작업 안에서 재시도하고 안내/최종 실패 메시지만 발송"""
+        # Given
+        with patch('telegram_bot_handler.LotteryService.update_latest_draw',
+                   new=AsyncMock(return_value=False)) as mock_update, \
+             patch('telegram_bot_handler.send_message_with_retry',
+                   new=AsyncMock(return_value=True)) as mock_send, \
+             patch('telegram_bot_handler.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+
+            # When
+            await telegram_bot_handler.update_lottery_results()
+
+        # Then
+        assert mock_update.call_count == telegram_bot_handler.UPDATE_MAX_RETRIES + 1
+        assert mock_sleep.call_count == telegram_bot_handler.UPDATE_MAX_RETRIES
+        assert mock_send.call_count == 2
+        assert "최종 실패" in mock_send.call_args_list[-1][0][2]
+
+    @pytest.mark.asyncio
+    async def test_announces_new_draw_on_success(self):
+        """업데이트 성공 시 데이터 서비스를 갱신하고 당첨번호를 알림"""
+        # Given
+        row = {"no": 1200, "1": 3, "2": 9, "3": 17, "4": 25, "5": 33, "6": 41, "bonus": 7}
+
+        with patch('telegram_bot_handler.LotteryService.update_latest_draw',
+                   new=AsyncMock(return_value=True)), \
+             patch('telegram_bot_handler.cached_last_draw',
+                   new=AsyncMock(return_value=row)), \
+             patch('telegram_bot_handler._sync_data_service',
+                   new=AsyncMock()) as mock_sync, \
+             patch('telegram_bot_handler.send_message_with_retry',
+                   new=AsyncMock(return_value=True)) as mock_send:
+
+            # When
+            await telegram_bot_handler.update_lottery_results()
+
+        # Then
+        mock_sync.assert_awaited_once_with(row)
+        assert mock_send.call_count == 1
+        message = mock_send.call_args[0][2]
+        assert "1200회 당첨번호 업데이트" in message
+        assert "보너스 번호: 7" in message
+
+
+class TestCachedLastDraw:
+    """최근 회차 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_cached_row_until_refresh(self, monkeypatch):
+        """TTL 이내 재조회는 DB를 거치지 않고, refresh면 다시 조회"""
+        # Given
+        monkeypatch.setattr(telegram_bot_handler, "_last_draw_cache", None)
+        row = {"no": 1200}
+
+        with patch('telegram_bot_handler.AsyncLottoRepository.get_last_draw',
+                   new=AsyncMock(return_value=row)) as mock_get:
+            # When
+            first = await telegram_bot_handler.cached_last_draw()
+            second = await telegram_bot_handler.cached_last_draw()
+            await telegram_bot_handler.cached_last_draw(refresh=True)
+
+        # Then
+        assert first is row and second is row
+        assert mock_get.call_count == 2
+
+
+class TestCachedNextDrawNo:
+    """다음 회차 번호 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_resyncs_when_loaded_data_is_behind(self, monkeypatch):
+        """다른 프로세스가 새 회차를 저장했으면 DB 기준 번호를 쓰고 데이터를 동기화"""
+        # Given
+        row = {"no": 1201}
+        loaded = MagicMock()
+        loaded.get_next_draw_no.return_value = 1201
+        monkeypatch.setattr(telegram_bot_handler, "data_service", loaded)
+
+        with patch('telegram_bot_handler.cached_last_draw', new=AsyncMock(return_value=row)), \
+             patch('telegram_bot_handler._sync_data_service', new=AsyncMock()) as mock_sync:
+            # When
+            next_no = await telegram_bot_handler.cached_next_draw_no()
+
+        # Then
+        assert next_no == 1202
+        mock_sync.assert_awaited_once_with(row)
+
+    @pytest.mark.asyncio
+    async def test_skips_sync_when_up_to_date(self, monkeypatch):
+        """로드된 데이터가 최신이면 동기화하지 않음"""
+        # Given
+        loaded = MagicMock()
+        loaded.get_next_draw_no.return_value = 1202
+        monkeypatch.setattr(telegram_bot_handler, "data_service", loaded)
+
+        with patch('telegram_bot_handler.cached_last_draw',
+                   new=AsyncMock(return_value={"no": 1201})), \
+             patch('telegram_bot_handler._sync_data_service', new=AsyncMock()) as mock_sync:
+            # When
+            next_no = await telegram_bot_handler.cached_next_draw_no()
+
+        # Then
+        assert next_no == 1202
+        mock_sync.assert_not_called()
+
+
+class TestDetermineRank:
+    """등수 판정 테스트"""
+
+    @pytest.mark.parametrize("matches, bonus_match, expected", [
+        (6, False, "1등"),
+        (5, True, "2등"),
+        (5, False, "3등"),
+        (4, True, "4등"),
+        (3, False, "5등"),
+        (2, True, "낙첨"),
+        (0, False, "낙첨"),
+    ])
+    def test_rank_table(self, matches, bonus_match, expected):
+        """일치 개수와 보너스 여부로 등수 판정"""
+        assert _determine_rank(matches, bonus_match) == expected
+
+
+class TestBotCommandsHash:
+    """명령어 메뉴 등록 생략 테스트"""
+
+    def test_hash_depends_on_bot(self):
+        """봇이 바뀌면 해시가 달라져 다시 등록됨"""
+        assert telegram_bot_handler._bot_commands_hash(1) != telegram_bot_handler._bot_commands_hash(2)
+
+    def test_roundtrip_and_missing_file(self, tmp_path, monkeypatch):
+        """저장한 해시를 다시 읽고(상위 디렉터리 자동 생성), 파일이 없으면 None"""
+        # Given
+        monkeypatch.setattr(telegram_bot_handler, "BOT_COMMANDS_HASH_FILE", tmp_path / "data" / "hash")
+
+        # When/Then
+        assert telegram_bot_handler._read_commands_hash() is None
+        telegram_bot_handler._write_commands_hash("abc")
+        assert telegram_bot_handler._read_commands_hash() == "abc"
+
+
+class TestWinningCache:
+    """회차별 당첨 번호 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_draw(self, monkeypatch):
+        """최대 개수를 넘으면 가장 오래 사용하지 않은 회차부터 제거"""
+        # Given
+        monkeypatch.setattr(telegram_bot_handler, "_winning_cache", OrderedDict())
+        monkeypatch.setattr(telegram_bot_handler, "WINNING_CACHE_SIZE", 2)
+
+        async def fake_get_draw(draw_no):
+            row = {str(i): i for i in range(1, 7)}
+            row.update({'no': draw_no, 'bonus': 7})
+            return row
+
+        with patch('telegram_bot_handler.AsyncLottoRepository.get_draw_by_no',
+                   new=AsyncMock(side_effect=fake_get_draw)) as mock_get:
+            # When
+            await telegram_bot_handler._get_winning_numbers(1)
+            await telegram_bot_handler._get_winning_numbers(2)
+            await telegram_bot_handler._get_winning_numbers(1)  # 캐시 적중, 최근 사용으로 이동
+            await telegram_bot_handler._get_winning_numbers(3)  # 2회차 제거
+
+        # Then
+        assert mock_get.call_count == 3
+        assert list(telegram_bot_handler._winning_cache) == [1, 3]
+
+
+class TestGenerateCommand:
+    """예측 생성 명령어 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_rejects_while_previous_request_running(self, monkeypatch):
+        """같은 사용자의 이전 요청이 처리 중이면 예측을 다시 생성하지 않음"""
+        # Given
+        monkeypatch.setattr(telegram_bot_handler, "_generating_users", {42})
+        service = MagicMock()
+        service.generate_predictions = AsyncMock()
+        monkeypatch.setattr(telegram_bot_handler, "prediction_service", service)
+
+        update = MagicMock()
+        update.effective_user.id = 42
+        update.message.reply_text = AsyncMock()
+        context = MagicMock(args=[])
+
+        # When
+        await telegram_bot_handler.generate_command.__wrapped__(update, context)
+
+        # Then
+        service.generate_predictions.assert_not_called()
+        assert "처리 중" in update.message.reply_text.call_args[0][0]
+        assert telegram_bot_handler._generating_users == {42}
+
+
+class TestGenerateWeeklyPredictions:
+    """주간 예측 자동 발송 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_long_message_is_sent_in_chunks(self, monkeypatch):
+        """메시지 길이 제한을 넘으면 줄 단위로 나눠 순서대로 발송"""
+        # Given
+        service = MagicMock()
+        service.generate_predictions = AsyncMock(return_value=[MagicMock()])
+        monkeypatch.setattr(telegram_bot_handler, "prediction_service", service)
+        lines = [f"{i:03d}" + "x" * 97 for i in range(60)]  # 약 6000자
+
+        with patch('telegram_bot_handler.cached_next_draw_no', new=AsyncMock(return_value=1200)), \
+             patch('telegram_bot_handler.AsyncLottoRepository.save_recommendations_batch',
+                   new=AsyncMock(return_value=1)), \
+             patch('telegram_bot_handler._format_prediction_message',
+                   return_value="\n".join(lines)), \
+             patch('telegram_bot_handler.send_message_with_retry',
+                   new=AsyncMock(return_value=True)) as mock_send:
+
+            # When
+            await telegram_bot_handler.generate_weekly_predictions()
+
+        # Then
+        chunks = [c[0][2] for c in mock_send.call_args_list]
+        assert len(chunks) == 2
+        assert all(len(chunk) <= 4096 for chunk in chunks)
+        assert "\n".join(chunks) == "\n".join(lines)
+
+    @pytest.mark.asyncio
+    async def test_stops_after_first_failed_chunk(self, monkeypatch):
+        """한 조각이라도 발송에 실패하면 이후 조각은 보내지 않음"""
+        # Given
+        service = MagicMock()
+        service.generate_predictions = AsyncMock(return_value=[MagicMock()])
+        monkeypatch.setattr(telegram_bot_handler, "prediction_service", service)
+        lines = [f"{i:03d}" + "x" * 97 for i in range(100)]  # 약 10000자, 3조각
+
+        with patch('telegram_bot_handler.cached_next_draw_no', new=AsyncMock(return_value=1200)), \
+             patch('telegram_bot_handler.AsyncLottoRepository.save_recommendations_batch',
+                   new=AsyncMock(return_value=1)), \
+             patch('telegram_bot_handler._format_prediction_message',
+                   return_value="\n".join(lines)), \
+             patch('telegram_bot_handler.send_message_with_retry',
+                   new=AsyncMock(side_effect=[True, False, True])) as mock_send:
+
+            # When
+            await telegram_bot_handler.generate_weekly_predictions()
+
+        # Then
+        assert mock_send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_syncs_draw_before_generating(self, monkeypatch):
+        """다음 회차 조회(데이터 동기화)가 끝난 뒤에 예측을 생성"""
+        # Given
+        calls = []
+
+        async def next_draw_no():
+            calls.append("next_draw_no")
+            return 1200
+
+        async def generate_predictions(num_predictions):
+            calls.append("generate")
+            return [MagicMock()]
+
+        service = MagicMock()
+        service.generate_predictions = generate_predictions
+        monkeypatch.setattr(telegram_bot_handler, "prediction_service", service)
+
+        with patch('telegram_bot_handler.cached_next_draw_no', new=next_draw_no), \
+             patch('telegram_bot_handler.AsyncLottoRepository.save_recommendations_batch',
+                   new=AsyncMock(return_value=1)), \
+             patch('telegram_bot_handler._format_prediction_message', return_value="msg"), \
+             patch('telegram_bot_handler.send_message_with_retry',
+                   new=AsyncMock(return_value=True)):
+
+            # When
+            await telegram_bot_handler.generate_weekly_predictions()
+
+        # Then
+        assert calls == ["next_draw_no", "generate"]